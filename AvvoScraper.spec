@@ -3,7 +3,7 @@ from PyInstaller.utils.hooks import collect_all
 
 datas = [('html_to_csv_converter.py', '.'), ('urls.txt', '.')]
 binaries = []
-hiddenimports = ['undetected_chromedriver', 'selenium', 'beautifulsoup4', 'pandas', 'lxml', 'bs4']
+hiddenimports = ['undetected_chromedriver', 'selenium', 'beautifulsoup4', 'lxml', 'bs4']
 tmp_ret = collect_all('undetected_chromedriver')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 tmp_ret = collect_all('selenium')
@@ -116,9 +116,6 @@ if errorlevel 1 set DEPS_MISSING=1
 %PYTHON_CMD% -c "import bs4" >nul 2>&1
 if errorlevel 1 set DEPS_MISSING=1
 
-%PYTHON_CMD% -c "import pandas" >nul 2>&1
-if errorlevel 1 set DEPS_MISSING=1
-
 %PYTHON_CMD% -c "import lxml" >nul 2>&1
 if errorlevel 1 set DEPS_MISSING=1
 
@@ -147,7 +144,7 @@ if %DEPS_MISSING% equ 1 (
     )
     
     echo Verifying installation...
-    %PYTHON_CMD% -c "import undetected_chromedriver; import selenium; import bs4; import pandas; import lxml" >nul 2>&1
+    %PYTHON_CMD% -c "import undetected_chromedriver; import selenium; import bs4; import lxml" >nul 2>&1
     if errorlevel 1 (
         echo [WARNING] Some packages may not have installed correctly
         echo Try running: %PYTHON_CMD% -m pip install -r requirements.txt
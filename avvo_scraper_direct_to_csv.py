@@ -6,22 +6,31 @@ No HTML files are saved - goes directly from scraping to CSV
 """
 
 import undetected_chromedriver as uc
-import time
+import requests
 import re
 import json
 import csv
 import os
 import sys
-import pandas as pd
+import io
+import contextlib
+import time
+import random
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup, SoupStrainer, Comment
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 
-# Import extraction and save functions from html_to_csv_converter
+# Import extraction and save functions (and the shared lxml/html.parser choice) from html_to_csv_converter
 try:
-    from html_to_csv_converter import extract_profile_data_from_html, save_to_csv
+    from html_to_csv_converter import extract_profile_data_from_soup, save_to_csv, HTML_PARSER, make_profile_soup
 except ImportError:
     print("❌ Error: Could not import from html_to_csv_converter.py")
     print("   Make sure html_to_csv_converter.py is in the same directory")
@@ -38,12 +47,93 @@ DAYS_BACK_DEFAULT = 365  # Default: 365 days
 # Output CSV filename
 OUTPUT_CSV = "Avvo_Scraping_data_output.csv"
 
+# Number of review pages downloaded in parallel - shared by all URL worker processes
+# (each gets PAGE_FETCH_WORKERS // URL_WORKERS, at least 1, so the total stays at this number)
+PAGE_FETCH_WORKERS = 4
+
+# Number of URLs scraped in parallel - each worker process runs its own Chrome
+# (half the CPU cores, at most 4, leaves room for the browsers; 1 = one at a time)
+URL_WORKERS = min(4, max(1, (os.cpu_count() or 2) // 2))
+
+# Consecutive failed URLs before waiting between URLs (1, 2, 4 ... minutes)
+# and before giving up on the rest of the batch
+BACKOFF_AFTER_FAILURES = 3
+MAX_CONSECUTIVE_FAILURES = 10
+
+# Random pause (seconds) before each URL in a worker process - spreads the requests out
+URL_START_JITTER = (0.5, 2.0)
+
+# Review pages this process may download at once (lowered in URL worker processes)
+_page_fetch_workers = PAGE_FETCH_WORKERS
+
+# Precompiled regex patterns (used once per review / per page / per CSV field)
+_WS_RE = re.compile(r'\s+')
+_POSTED_BY_RE = re.compile(r'Posted by .+?\s*\|\s*(.+?)(?:\s*\|)?$')
+_TRAILING_PIPE_RE = re.compile(r'\s*\|\s*.*$')
+_TOOLTIP_RE = re.compile(r'tooltip')
+_PAGE_NUM_RE = re.compile(r'page=(\d+)')
+_PAGE_OF_RE = re.compile(r'(?:Page\s+)?\d+\s+of\s+(\d+)', re.IGNORECASE)
+_PAGE_OF_HINT_RE = re.compile(r'Page|of')
+_NO_REVIEWS_RE = re.compile(r'no (more )?reviews', re.IGNORECASE)
+_FAST_DATE_RE = re.compile(r'^([A-Z][a-z]{2,8})\s+(\d{1,2}),\s*(\d{4})$')
+_USER_ID_RE = re.compile(r'/attorneys/([^/]+)\.html')
+
+# Month names for the fast date path ("February" and "Feb" -> 2)
+_MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December']
+_MONTHS = {name: num for num, name in enumerate(_MONTH_NAMES, 1)}
+_MONTHS.update({name[:3]: num for num, name in enumerate(_MONTH_NAMES, 1)})
+
+# XPath for Avvo's "no reviews" message (case-insensitive, visible text only - not script/style bodies)
+_NO_REVIEWS_XPATH = "//*[not(self::script or self::style)][contains(translate(text(), 'NOREVIWS', 'noreviws'), 'no reviews')]"
+
+# Review fields added to every CSV row (after the profile fields, in this order)
+_REVIEW_KEYS = ('reviewer_name', 'review_date', 'review_rating', 'review_title', 'review_text',
+                'review_type', 'review_tooltip', 'attorney_response_name', 'attorney_response_date',
+                'attorney_response_text')
+_EMPTY_REVIEW = dict.fromkeys(_REVIEW_KEYS)
+
+# Free-text fields cleaned before writing (whitespace collapsed so every row stays on one CSV line)
+_PROFILE_TEXT_FIELDS = ('biography', 'company_address', 'education', 'bar_admissions', 'honors_awards',
+                        'associations', 'work_experience', 'practice_areas', 'additional_practice_areas',
+                        'practice_area_percentages', 'cost_details', 'retainer_info',
+                        'payment_methods', 'license_details')
+_REVIEW_TEXT_FIELDS = ('review_text', 'review_title', 'attorney_response_text')
+
+# Parse only the review cards of extra review pages
+_REVIEW_STRAINER = SoupStrainer('div', class_='client-review')
+
+# CSS selectors for the reviews container on the main page, in priority order
+# ([class*="review" i] also matches the client-review divs themselves)
+_REVIEWS_CONTAINER_SELECTORS = (
+    'div.reviews',
+    'div[class*="review" i]',
+    'section.review-section',
+    'div#reviews',
+    'div.review-body',
+)
+
+@lru_cache(maxsize=4096)
 def parse_review_date(date_str):
-    """Parse review date from various formats. Returns datetime object or None."""
+    """
+    Parse review date from various formats. Returns datetime object or None.
+    Cached by date string - many reviews share the same posting date.
+    """
     if not date_str:
         return None
     
     date_str = date_str.strip()
+    
+    # Fast path for the common "February 1, 2018" / "Feb 1, 2018" shape - no strptime
+    match = _FAST_DATE_RE.match(date_str)
+    if match:
+        month = _MONTHS.get(match.group(1))
+        if month:
+            try:
+                return datetime(int(match.group(3)), month, int(match.group(2)))
+            except ValueError:
+                pass
+    
     date_formats = [
         '%B %d, %Y',      # February 1, 2018
         '%b %d, %Y',      # Feb 1, 2018
@@ -61,28 +151,82 @@ def parse_review_date(date_str):
     return None
 
 
-def extract_review_date_from_html(review_html):
-    """Extract date from a review HTML element."""
-    soup = BeautifulSoup(review_html, 'html.parser')
-    header = soup.find('div', class_='client-review-header')
+def _inside_tooltip(elem, container):
+    """True if elem sits inside a tooltip div somewhere below container."""
+    for parent in elem.parents:
+        if parent is container:
+            return False
+        if parent.name == 'div' and any(_TOOLTIP_RE.search(c) for c in parent.get('class', ())):
+            return True
+    return False
+
+
+def extract_review_date_from_tag(review_tag):
+    """Extract date from a review element (BeautifulSoup Tag). Read-only - the review is not modified."""
+    header = review_tag.find('div', class_='client-review-header')
     if header:
-        # Remove tooltip
-        for tooltip in header.find_all(['div'], class_=re.compile(r'tooltip')):
-            tooltip.decompose()
+        # Structured date if the header has one (<time datetime="2024-05-01...">) - no text parsing
+        time_elem = header.find('time', attrs={'datetime': True})
+        if time_elem:
+            try:
+                return datetime.fromisoformat(time_elem['datetime'][:10])
+            except ValueError:
+                pass  # Fall back to the header text
         
-        first_para = header.find('p')
+        # First paragraph of the header, skipping tooltip text (instead of copying the header and removing it)
+        first_para = next((p for p in header.find_all('p') if not _inside_tooltip(p, header)), None)
         if first_para:
-            para_text = first_para.get_text(separator=' ', strip=True)
-            para_text = re.sub(r'\s+', ' ', para_text)
+            para_text = ' '.join(text.strip() for text in first_para.find_all(string=True)
+                                 if text.strip() and not isinstance(text, Comment)
+                                 and not _inside_tooltip(text, first_para))
+            para_text = _WS_RE.sub(' ', para_text)
             
-            match = re.search(r'Posted by .+?\s*\|\s*(.+?)(?:\s*\|)?$', para_text)
+            match = _POSTED_BY_RE.search(para_text)
             if match:
                 date_str = match.group(1).strip()
-                date_str = re.sub(r'\s*\|\s*.*$', '', date_str).strip()
+                date_str = _TRAILING_PIPE_RE.sub('', date_str).strip()
                 return parse_review_date(date_str)
     return None
 
 
+def _scan_page(page_soup, cutoff_date, days_back):
+    """
+    Collect the reviews of one pagination page that are within the date range
+    
+    Args:
+        page_soup: BeautifulSoup object of the review page
+        cutoff_date: Oldest review date to keep (None = keep all reviews)
+        days_back: Number of days of the date filter (used in messages)
+    
+    Returns:
+        Tuple of (list of review Tags to keep, True if an older review was found and pagination should stop)
+    """
+    review_containers = page_soup.find_all('div', class_='client-review')
+    should_stop = False
+    
+    if not cutoff_date:
+        # No date filter - keep the whole page without looking at dates
+        review_tags = list(review_containers)
+    else:
+        review_tags = []
+        # Check reviews one by one - stop immediately when we find an old one
+        # (reviews whose date can't be parsed are kept to be safe)
+        for review in review_containers:
+            review_date = extract_review_date_from_tag(review)
+            if review_date and review_date < cutoff_date:
+                print(f"      ⚠️  Found review older than {days_back} days ({review_date.strftime('%Y-%m-%d')}) - stopping immediately")
+                should_stop = True
+                break
+            review_tags.append(review)
+    
+    if should_stop:
+        print(f"      ⏹️  Stopped after checking {len(review_tags) + 1} review(s) - found old review")
+    elif review_tags:
+        print(f"      ✅ Found {len(review_containers)} reviews, added {len(review_tags)} (within date range)")
+    
+    return review_tags, should_stop
+
+
 def read_urls_from_file(file_path):
     """
     Read URLs from a text file (one URL per line)
@@ -148,104 +292,321 @@ def read_urls_from_file(file_path):
     return urls, days_back
 
 
-def save_to_csv_append(data, reviews, output_csv_path, is_first_url=False):
+def _clean_text_fields(row, fields):
     """
-    Save extracted data and reviews to CSV file (append mode with blank line between URLs)
+    Collapse newlines, carriage returns and multiple spaces into single spaces (prevents CSV row breaks)
     
     Args:
-        data: Dictionary with profile data
-        reviews: List of review dictionaries
-        output_csv_path: Path to output CSV file
-        is_first_url: If True, write header. If False, append without header.
-    """
-    # Create rows - one row per review with all profile data
-    rows = []
-    
-    # If there are reviews, create one row per review with all profile data
-    if reviews:
-        for review in reviews:
-            row = data.copy()
-            # Add review-specific fields to each row
-            row['reviewer_name'] = review.get('reviewer_name')
-            row['review_date'] = review.get('review_date')
-            row['review_rating'] = review.get('review_rating')
-            row['review_title'] = review.get('review_title')
-            row['review_text'] = review.get('review_text')
-            row['review_type'] = review.get('review_type')
-            row['review_tooltip'] = review.get('review_tooltip')
-            # Add attorney response fields
-            row['attorney_response_name'] = review.get('attorney_response_name')
-            row['attorney_response_date'] = review.get('attorney_response_date')
-            row['attorney_response_text'] = review.get('attorney_response_text')
-            rows.append(row)
-    else:
-        # No reviews - just one row with profile data and empty review fields
-        row = data.copy()
-        row['reviewer_name'] = None
-        row['review_date'] = None
-        row['review_rating'] = None
-        row['review_title'] = None
-        row['review_text'] = None
-        row['review_type'] = None
-        row['review_tooltip'] = None
-        row['attorney_response_name'] = None
-        row['attorney_response_date'] = None
-        row['attorney_response_text'] = None
-        rows.append(row)
-    
-    # Clean text fields - replace newlines with spaces to prevent CSV row breaks
-    text_fields = ['review_text', 'review_title', 'attorney_response_text', 'biography', 'company_address', 
-                    'education', 'bar_admissions', 'honors_awards', 'associations', 
-                    'work_experience', 'practice_areas', 'additional_practice_areas',
-                    'practice_area_percentages', 'cost_details', 'retainer_info',
-                    'payment_methods', 'license_details']
-    
-    for row in rows:
-        for field in text_fields:
-            if field in row and row[field] is not None:
-                # Replace newlines and carriage returns with spaces
-                row[field] = str(row[field]).replace('\n', ' ').replace('\r', ' ')
-                # Clean up multiple spaces
-                row[field] = re.sub(r'\s+', ' ', row[field]).strip()
-    
-    # Create DataFrame
-    df = pd.DataFrame(rows)
-    
-    # Append mode: if file exists and not first URL, append without header
-    if os.path.exists(output_csv_path) and not is_first_url:
-        # Append mode - add blank row first (empty row with all columns)
-        # Read existing CSV to get column names
-        existing_df = pd.read_csv(output_csv_path, nrows=0)  # Read only header
-        blank_row = pd.DataFrame([{col: '' for col in existing_df.columns}])
-        blank_row.to_csv(output_csv_path, mode='a', index=False, header=False, encoding='utf-8', quoting=csv.QUOTE_MINIMAL)
-        # Now append the actual data
-        df.to_csv(output_csv_path, mode='a', index=False, header=False, encoding='utf-8', quoting=csv.QUOTE_MINIMAL)
-    else:
-        # Write mode - create new file with header
-        df.to_csv(output_csv_path, index=False, encoding='utf-8', quoting=csv.QUOTE_MINIMAL)
+        row: Row dictionary (modified in place)
+        fields: Names of the text fields to clean
     
-    # Display review count
-    if reviews:
-        print(f"✅ Added {len(rows)} rows ({len(reviews)} reviews + profile data in each row)")
-    else:
-        print(f"✅ Added 1 row (profile data, no reviews)")
+    Returns:
+        The same row dictionary
+    """
+    for field in fields:
+        if row.get(field) is not None:
+            row[field] = _WS_RE.sub(' ', str(row[field])).strip()
+    return row
+
+
+class CsvSink:
+    """
+    CSV output that stays open for the whole batch run
+    One row per review (with all profile data), blank row between URLs
+    
+    Usage:
+        with CsvSink(OUTPUT_CSV) as sink:
+            sink.write_profile(data, reviews)
+    """
+    
+    def __init__(self, output_csv_path):
+        """
+        Args:
+            output_csv_path: Path to output CSV file (created/overwritten on the first write)
+        """
+        self.output_csv_path = output_csv_path
+        self._fh = None
+        self._writer = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def write_profile(self, data, reviews):
+        """
+        Write extracted data and reviews for one URL
+        Rows are built and cleaned lazily and handed to writerows() in one call - no list of rows is kept
+        
+        Args:
+            data: Dictionary with profile data
+            reviews: Iterable of review dictionaries (list or generator)
+        """
+        if self._writer is None:
+            # First URL - create new file with header (profile columns, then review columns)
+            # Large write buffer - rows are flushed in big blocks, not per row
+            self._fh = open(self.output_csv_path, 'w', encoding='utf-8', newline='', buffering=1 << 20)
+            self._writer = csv.DictWriter(self._fh, fieldnames=list({**data, **_EMPTY_REVIEW}),
+                                          quoting=csv.QUOTE_MINIMAL, lineterminator=os.linesep)
+            self._writer.writeheader()
+        else:
+            # Following URLs - blank row (empty value for every column) before the new data
+            self._writer.writerow({})
+        
+        # Profile fields are the same in every row - clean them once per URL
+        profile = _clean_text_fields(dict(data), _PROFILE_TEXT_FIELDS)
+        
+        # One row per review with all profile data
+        # (one dict merge per row instead of a copy plus ten assignments)
+        review_count = 0
+        
+        def review_rows():
+            nonlocal review_count
+            for review in reviews or ():
+                row = {**profile, **{key: review.get(key) for key in _REVIEW_KEYS}}
+                review_count += 1
+                yield _clean_text_fields(row, _REVIEW_TEXT_FIELDS)
+        
+        self._writer.writerows(review_rows())
+        
+        # Display review count
+        if review_count:
+            print(f"✅ Added {review_count} rows ({review_count} reviews + profile data in each row)")
+        else:
+            # No reviews - just one row with profile data and empty review fields
+            self._writer.writerow({**profile, **_EMPTY_REVIEW})
+            print(f"✅ Added 1 row (profile data, no reviews)")
+        
+        return True
     
-    return True
+    def close(self):
+        """Close the output file (safe to call more than once)"""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
 
 
-def scrape_and_convert_to_csv(url, days_back=None, save_html=False):
+class ReviewPageFetcher:
+    """
+    Fetches additional review pages with a requests.Session that carries the browser's
+    cookies and User-Agent (no page render, no JS)
+    Falls back to loading the page in the browser if the response looks like a Cloudflare challenge
+    or any other page that is neither a review page nor Avvo's "no reviews" page
+    """
+    
+    def __init__(self, driver):
+        """
+        Args:
+            driver: Chrome driver that already passed Cloudflare on the profile page
+        """
+        self.driver = driver
+        self.session = None  # Built on first use - no browser round-trips for profiles without extra pages
+        self.use_session = True  # Turned off after the first blocked or failed request
+    
+    def _get_session(self):
+        """Create the requests session from the browser's cookies and User-Agent (once)"""
+        if self.session is None:
+            self.session = requests.Session()
+            self.session.headers['User-Agent'] = self.driver.execute_script("return navigator.userAgent")
+            for cookie in self.driver.get_cookies():
+                self.session.cookies.set(cookie['name'], cookie['value'],
+                                         domain=cookie.get('domain'), path=cookie.get('path', '/'))
+        return self.session
+    
+    def _session_get(self, page_url):
+        """Get page HTML with the requests session. Returns None if blocked or failed."""
+        try:
+            response = self._get_session().get(page_url, timeout=20)
+        except requests.RequestException as e:
+            print(f"      ⚠️  Direct request failed ({e}) - using browser")
+            return None
+        if not response.ok or "Just a moment" in response.text:
+            print(f"      ⚠️  Cloudflare blocked direct request (HTTP {response.status_code}) - using browser")
+            return None
+        if 'client-review' not in response.text and not _NO_REVIEWS_RE.search(response.text):
+            # A 200 page without review cards or the "no reviews" message - an interstitial
+            # or block page, not the end of the reviews
+            print(f"      ⚠️  Direct request returned no review page (HTTP {response.status_code}) - using browser")
+            return None
+        return response.text
+    
+    def fetch_many(self, page_urls):
+        """
+        Download several review pages at once (one parallel HTTP request per page)
+        
+        Args:
+            page_urls: List of review page URLs
+        
+        Returns:
+            List of HTML strings in the same order - None for pages that have to be loaded with fetch()
+        """
+        if not self.use_session:
+            return [None] * len(page_urls)
+        
+        self._get_session()  # Built here, not in the worker threads
+        with ThreadPoolExecutor(max_workers=len(page_urls)) as executor:
+            page_htmls = list(executor.map(self._session_get, page_urls))
+        
+        if None in page_htmls:
+            # Don't keep trying the session for the remaining pages
+            self.use_session = False
+        return page_htmls
+    
+    def fetch(self, page_url):
+        """
+        Get the HTML of a review page
+        
+        Args:
+            page_url: Review page URL
+        
+        Returns:
+            HTML content as string
+        """
+        if self.use_session:
+            page_html = self._session_get(page_url)
+            if page_html is not None:
+                return page_html
+            # Don't keep trying the session for the remaining pages
+            self.use_session = False
+        
+        self.driver.get(page_url)
+        
+        # Wait for Cloudflare if needed (quick check)
+        if "Just a moment" in self.driver.title:
+            try:
+                WebDriverWait(self.driver, 5).until(lambda d: "Just a moment" not in d.title)
+            except:
+                pass  # Continue anyway
+        
+        _wait_for_reviews(self.driver)
+        return self.driver.page_source
+
+
+def _wait_for_reviews(driver, timeout=8):
+    """
+    Wait until the page shows review cards or Avvo's "no reviews" message
+    (returns as soon as either is in the DOM instead of sleeping a fixed time)
+    
+    Args:
+        driver: Chrome driver
+        timeout: Maximum seconds to wait
+    
+    Returns:
+        True if reviews or the "no reviews" message appeared, False on timeout
+    """
+    try:
+        WebDriverWait(driver, timeout).until(EC.any_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.client-review")),
+            EC.presence_of_element_located((By.XPATH, _NO_REVIEWS_XPATH)),
+        ))
+        return True
+    except TimeoutException:
+        return False
+
+
+def init_chrome_driver(user_multi_procs=False):
+    """
+    Start an undetected Chrome browser
+    keep_alive=True keeps the HTTP connection to chromedriver open between commands
+    
+    Args:
+        user_multi_procs: True in URL worker processes - reuse the chromedriver binary patched by
+                          prepare_chromedriver() instead of re-patching it while other browsers run it
+    
+    Returns:
+        uc.Chrome driver
+    """
+    # Create options
+    options = uc.ChromeOptions()
+    # options.add_argument('--headless=new')  # Uncomment for headless mode
+    
+    # Don't download images or show notification prompts - only the HTML is used
+    # (JavaScript stays on - Cloudflare's challenge needs it)
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+    })
+    
+    # Initialize undetected Chrome driver
+    return uc.Chrome(options=options, keep_alive=True, user_multi_procs=user_multi_procs)
+
+
+def prepare_chromedriver():
+    """
+    Download and patch the chromedriver binary once, before the URL worker processes start
+    (each uc.Chrome() normally rewrites the same binary - parallel starts would race on it)
+    
+    Returns:
+        True if the patched binary is ready, False if it could not be prepared
+    """
+    try:
+        uc.Patcher().auto()
+        return True
+    except Exception as e:
+        print(f"⚠️  Could not prepare chromedriver for parallel browsers: {e}")
+        return False
+
+
+def _reset_driver(driver):
+    """
+    Leave a shared browser on a blank page before the next URL
+    (frees the previous profile's DOM and scripts; cookies are kept so the Cloudflare clearance carries over)
+    """
+    try:
+        driver.get('about:blank')
+    except:
+        pass
+
+
+def _driver_alive(driver):
+    """
+    Check that the browser session still answers (a crashed Chrome or a dropped session fails every later URL)
+    
+    Returns:
+        True if the session is usable, False if it should be replaced
+    """
+    try:
+        driver.title
+        return True
+    except:
+        return False
+
+
+def _restart_driver(driver):
+    """
+    Quit a dead browser session and start a new one
+    
+    Returns:
+        New driver, or None if Chrome could not be started again
+    """
+    print("🔄 Browser session was lost - starting a new one...")
+    try:
+        driver.quit()
+    except:
+        pass
+    try:
+        return init_chrome_driver()
+    except Exception as e:
+        print(f"❌ Could not restart Chrome: {e}")
+        return None
+
+
+def scrape_and_convert_to_csv(url, days_back=None, save_html=False, driver=None):
     """
     Scrape Avvo profile and save directly to CSV
     
     Args:
         url: Avvo profile URL
         days_back: Number of days back to filter reviews (None = all reviews)
-        save_html: If True, also save HTML file (default: False)
+        save_html: If True, also save the combined profile HTML (without scripts/styles) (default: False)
+        driver: Existing Chrome driver to reuse (default: None = start a new browser and close it when done)
     
     Returns:
         Path to CSV file or None if failed
     """
-    driver = None
+    owns_driver = driver is None
     try:
         # Calculate cutoff date if days_back filter is set
         cutoff_date = None
@@ -262,14 +623,9 @@ def scrape_and_convert_to_csv(url, days_back=None, save_html=False):
         print("\n" + "="*80)
         print(f"AVVO PROFILE SCRAPER - DIRECT TO CSV{filter_info}")
         print("="*80)
-        print(f"Starting undetected Chrome browser...")
-        
-        # Create options
-        options = uc.ChromeOptions()
-        # options.add_argument('--headless=new')  # Uncomment for headless mode
-        
-        # Initialize undetected Chrome driver
-        driver = uc.Chrome(options=options)
+        if owns_driver:
+            print(f"Starting undetected Chrome browser...")
+            driver = init_chrome_driver()
         
         print(f"\n🌐 Navigating to: {url}")
         driver.get(url)
@@ -286,7 +642,6 @@ def scrape_and_convert_to_csv(url, days_back=None, save_html=False):
                 # Wait for Cloudflare to complete
                 wait.until(lambda d: "Just a moment" not in d.title)
                 print("✅ Cloudflare challenge completed!")
-                time.sleep(1)  # Reduced from 2 to 1 second
             else:
                 print("✅ No Cloudflare challenge detected")
             
@@ -296,8 +651,8 @@ def scrape_and_convert_to_csv(url, days_back=None, save_html=False):
             
         except Exception as e:
             print("⚠️  Waiting for page elements...")
-            # Fallback: just wait a bit and continue
-            time.sleep(2)
+            # Fallback: give the reviews a moment to render and continue
+            _wait_for_reviews(driver, timeout=2)
         
         # Try to find profile name to confirm page loaded
         try:
@@ -306,19 +661,22 @@ def scrape_and_convert_to_csv(url, days_back=None, save_html=False):
         except:
             print("⚠️  Could not find profile name element (continuing anyway)")
         
-        # Get the main page source
-        html_content = driver.page_source
-        main_soup = BeautifulSoup(html_content, 'html.parser')
+        # Parse the main page once - additional reviews are appended to this tree
+        # and the final data is extracted from it directly
+        # (scripts/styles/etc. are skipped the same way as in the converter - also when
+        # save_html is on, so review and pagination lookups always see the same tree)
+        main_soup = make_profile_soup(driver.page_source)
         
         # Filter main page reviews if date filter is enabled
         should_stop_main = False
+        checked_reviews = set()  # id() of reviews whose date was already checked and kept
         if cutoff_date:
             print("\n📅 Filtering reviews from main page...")
             main_reviews = main_soup.find_all('div', class_='client-review')
             filtered_count = 0
             
             for review in main_reviews:
-                review_date = extract_review_date_from_html(str(review))
+                review_date = extract_review_date_from_tag(review)
                 if review_date:
                     if review_date < cutoff_date:
                         # Review is too old - remove it and stop checking
@@ -328,6 +686,7 @@ def scrape_and_convert_to_csv(url, days_back=None, save_html=False):
                         print(f"   ⚠️  Found review older than {days_back} days on main page ({review_date.strftime('%Y-%m-%d')})")
                         break
                 # If date couldn't be parsed, keep the review to be safe
+                checked_reviews.add(id(review))
             
             if should_stop_main:
                 print(f"   ✅ Filtered main page - stopping pagination (found old review)")
@@ -341,68 +700,49 @@ def scrape_and_convert_to_csv(url, days_back=None, save_html=False):
         
         # Extract base URL (without query parameters)
         base_url = url.split('?')[0]
-        review_page_urls = set()
+        review_pages = {}  # page number -> URL (first URL found for each page wins)
         
+        # All discovery below works on main_soup (already parsed) - no Selenium round-trips per element
         # Method 1: Look for pagination links in the page
-        pagination_links = driver.find_elements(By.CSS_SELECTOR, "a[href*='page=']")
-        for link in pagination_links:
-            href = link.get_attribute('href')
-            if href and 'page=' in href:
-                # Extract page number
-                page_match = re.search(r'page=(\d+)', href)
-                if page_match:
-                    page_num = int(page_match.group(1))
-                    # Normalize URL
-                    if href.startswith('/'):
-                        href = 'https://www.avvo.com' + href
-                    elif not href.startswith('http'):
-                        href = base_url + '?page=' + str(page_num)
-                    review_page_urls.add((page_num, href))
+        for link in main_soup.select("a[href*='page=']"):
+            href = link.get('href')
+            # Extract page number
+            page_match = _PAGE_NUM_RE.search(href)
+            if page_match:
+                page_num = int(page_match.group(1))
+                # Normalize URL (href attribute may be relative)
+                review_pages.setdefault(page_num, urljoin(base_url, href))
         
         # Method 2: Check for "Next" button or page numbers in reviews section
-        try:
-            # Look for pagination controls
-            pagination_elements = driver.find_elements(By.CSS_SELECTOR, ".pagination a, .page-numbers a, [class*='pagination'] a")
-            for elem in pagination_elements:
-                href = elem.get_attribute('href')
-                text = elem.text.strip()
-                if href and ('page=' in href or text.isdigit()):
-                    if 'page=' in href:
-                        page_match = re.search(r'page=(\d+)', href)
-                    elif text.isdigit():
-                        page_num = int(text)
-                        href = base_url + f"?page={page_num}"
-                        page_match = (page_num,)
-                    else:
-                        continue
-                    
-                    if page_match:
-                        page_num = int(page_match.group(1) if isinstance(page_match, re.Match) else page_match[0])
-                        if not href.startswith('http'):
-                            href = base_url + f"?page={page_num}"
-                        review_page_urls.add((page_num, href))
-        except:
-            pass
+        # Look for pagination controls
+        for elem in main_soup.select(".pagination a, .page-numbers a, [class*='pagination'] a"):
+            href = elem.get('href')
+            text = elem.get_text(strip=True)
+            if href and 'page=' in href:
+                page_match = _PAGE_NUM_RE.search(href)
+                if page_match:
+                    review_pages.setdefault(int(page_match.group(1)), urljoin(base_url, href))
+            elif href and text.isdigit():
+                page_num = int(text)
+                review_pages.setdefault(page_num, base_url + f"?page={page_num}")
         
         # Method 3: Try to find max page number from pagination text
-        try:
-            pagination_text = driver.find_elements(By.XPATH, "//*[contains(text(), 'Page') or contains(text(), 'of')]")
-            for elem in pagination_text:
-                text = elem.text
-                # Look for patterns like "Page 1 of 5" or "1 of 5"
-                match = re.search(r'(?:Page\s+)?\d+\s+of\s+(\d+)', text, re.IGNORECASE)
-                if match:
-                    max_page = int(match.group(1))
-                    # Generate URLs for all pages
-                    for page_num in range(2, max_page + 1):  # Start from 2 (page 1 is already loaded)
-                        page_url = base_url + f"?page={page_num}"
-                        review_page_urls.add((page_num, page_url))
-                    break
-        except:
-            pass
+        for text_node in main_soup.find_all(string=_PAGE_OF_HINT_RE):
+            elem = text_node.parent
+            if elem.name in ('script', 'style'):
+                continue
+            # Look for patterns like "Page 1 of 5" or "1 of 5"
+            match = _PAGE_OF_RE.search(elem.get_text(' ', strip=True))
+            if match:
+                max_page = int(match.group(1))
+                # Generate URLs for all pages
+                for page_num in range(2, max_page + 1):  # Start from 2 (page 1 is already loaded)
+                    page_url = base_url + f"?page={page_num}"
+                    review_pages.setdefault(page_num, page_url)
+                break
         
         # Sort by page number and filter out page 1 (already loaded)
-        review_page_urls = sorted([(p, u) for p, u in review_page_urls if p > 1], key=lambda x: x[0])
+        review_page_urls = sorted(item for item in review_pages.items() if item[0] > 1)
         
         if review_page_urls:
             print(f"✅ Found {len(review_page_urls)} additional review page(s)")
@@ -411,87 +751,60 @@ def scrape_and_convert_to_csv(url, days_back=None, save_html=False):
         else:
             print("   No additional review pages found")
         
-        # Load all review pages
-        all_reviews_html = []
+        # Load all review pages (review Tags are kept as-is, no string round-trip)
+        all_review_tags = []
         pages_loaded_count = 1
         
+        # Additional pages are fetched over HTTP with the browser's cookies (browser is only the fallback)
+        # - the HTTP session itself is only built once the first extra page is requested
+        fetcher = ReviewPageFetcher(driver)
+        
         if cutoff_date and should_stop_main:
             print(f"\n⏭️  Skipping pagination - found old review on main page")
             review_page_urls = []
         
         if review_page_urls:
             print(f"\n📄 Loading additional review pages...")
-            for page_num, page_url in review_page_urls:
-                if cutoff_date and should_stop_main:
-                    break
+            stop_loading = False
+            # Pages are downloaded a window at a time, then checked in page order
+            # (with a date cutoff the window starts at one page and doubles while pages stay in range,
+            # so the page that ends the scan isn't followed by requests that are thrown away)
+            window_size = 1 if cutoff_date else _page_fetch_workers
+            window_start = 0
+            while window_start < len(review_page_urls):
+                window = review_page_urls[window_start:window_start + window_size]
+                window_start += len(window)
+                page_htmls = fetcher.fetch_many([page_url for _, page_url in window])
                 
-                print(f"   Loading page {page_num}...")
-                try:
-                    driver.get(page_url)
-                    time.sleep(1)  # Reduced from 2 to 1 second
-                    
-                    # Wait for Cloudflare if needed (quick check)
-                    if "Just a moment" in driver.title:
-                        try:
-                            WebDriverWait(driver, 5).until(lambda d: "Just a moment" not in d.title)
-                        except:
-                            pass  # Continue anyway
-                    
-                    page_soup = BeautifulSoup(driver.page_source, 'html.parser')
-                    review_containers = page_soup.find_all('div', class_='client-review')
-                    
-                    if review_containers:
-                        reviews_added = 0
-                        should_stop = False
-                        
-                        # Check reviews one by one - stop immediately when we find an old one
-                        for review in review_containers:
-                            review_html = str(review)
-                            
-                            # Check date if filter is enabled
-                            if cutoff_date:
-                                review_date = extract_review_date_from_html(review_html)
-                                
-                                if review_date:
-                                    if review_date < cutoff_date:
-                                        # Review is too old - STOP IMMEDIATELY, don't check remaining reviews
-                                        print(f"      ⚠️  Found review older than {days_back} days ({review_date.strftime('%Y-%m-%d')}) - stopping immediately")
-                                        should_stop = True
-                                        break  # Exit review loop immediately
-                                    else:
-                                        # Review is within date range - add it
-                                        all_reviews_html.append(review_html)
-                                        reviews_added += 1
-                                else:
-                                    # Couldn't parse date - include it to be safe
-                                    all_reviews_html.append(review_html)
-                                    reviews_added += 1
-                            else:
-                                # No date filter - add all reviews
-                                all_reviews_html.append(review_html)
-                                reviews_added += 1
-                            
-                            # If we found an old review, stop checking remaining reviews on this page
-                            if should_stop:
-                                break
-                        
-                        if reviews_added > 0 and not should_stop:
-                            print(f"      ✅ Found {len(review_containers)} reviews, added {reviews_added} (within date range)")
-                            pages_loaded_count += 1
-                        elif should_stop:
-                            print(f"      ⏹️  Stopped after checking {reviews_added + 1} review(s) - found old review")
+                for (page_num, page_url), page_html in zip(window, page_htmls):
+                    print(f"   Loading page {page_num}...")
+                    try:
+                        # Only the review cards of extra pages are needed - skip building the rest of the tree
+                        page_html = page_html or fetcher.fetch(page_url)
+                        page_soup = BeautifulSoup(page_html, HTML_PARSER, parse_only=_REVIEW_STRAINER)
+                        review_tags, should_stop = _scan_page(page_soup, cutoff_date, days_back)
+                        all_review_tags.extend(review_tags)
                         
                         # Stop loading more pages if we found an old review
                         if should_stop:
                             should_stop_main = True
                             break  # Exit page loop - don't load next page
-                    else:
-                        print(f"      ⚠️  No reviews found on page {page_num} - stopping")
-                        break
                         
-                except Exception as e:
-                    print(f"      ❌ Error loading page {page_num}: {e}")
+                        if not review_tags:
+                            print(f"      ⚠️  No reviews found on page {page_num} - stopping")
+                            stop_loading = True
+                            break
+                        
+                        pages_loaded_count += 1
+                        
+                    except Exception as e:
+                        print(f"      ❌ Error loading page {page_num}: {e}")
+                        stop_loading = True
+                        break
+                
+                if should_stop_main or stop_loading:
                     break
+                window_size = min(window_size * 2, _page_fetch_workers)
         
         # If we didn't find all pages upfront, try iterative approach
         if not review_page_urls and not should_stop_main:
@@ -500,174 +813,116 @@ def scrape_and_convert_to_csv(url, days_back=None, save_html=False):
             consecutive_empty_pages = 0
             max_empty_pages = 2
             
-            while consecutive_empty_pages < max_empty_pages:
-                page_url = base_url + f"?page={page_num}"
-                print(f"   Trying page {page_num}...")
+            stop_loading = False
+            window_size = 1 if cutoff_date else _page_fetch_workers  # Grows like the window above
+            
+            while consecutive_empty_pages < max_empty_pages and not (should_stop_main or stop_loading):
+                # Download the next window of pages at once, then check them in page order
+                window = [(n, base_url + f"?page={n}") for n in range(page_num, page_num + window_size)]
+                page_htmls = fetcher.fetch_many([page_url for _, page_url in window])
                 
-                try:
-                    driver.get(page_url)
-                    time.sleep(1)  # Reduced from 2 to 1 second
-                    
-                    # Wait for Cloudflare if needed (quick check)
-                    if "Just a moment" in driver.title:
-                        try:
-                            WebDriverWait(driver, 5).until(lambda d: "Just a moment" not in d.title)
-                        except:
-                            pass  # Continue anyway
-                    
-                    page_soup = BeautifulSoup(driver.page_source, 'html.parser')
-                    review_containers = page_soup.find_all('div', class_='client-review')
+                for (page_num, page_url), page_html in zip(window, page_htmls):
+                    print(f"   Trying page {page_num}...")
                     
-                    if review_containers:
-                        reviews_added = 0
-                        should_stop = False
-                        
-                        # Check reviews one by one - stop immediately when we find an old one
-                        for review in review_containers:
-                            review_html = str(review)
-                            
-                            # Check date if filter is enabled
-                            if cutoff_date:
-                                review_date = extract_review_date_from_html(review_html)
-                                
-                                if review_date:
-                                    if review_date < cutoff_date:
-                                        # Review is too old - STOP IMMEDIATELY, don't check remaining reviews
-                                        print(f"      ⚠️  Found review older than {days_back} days ({review_date.strftime('%Y-%m-%d')}) - stopping immediately")
-                                        should_stop = True
-                                        break  # Exit review loop immediately
-                                    else:
-                                        # Review is within date range - add it
-                                        all_reviews_html.append(review_html)
-                                        reviews_added += 1
-                                else:
-                                    # Couldn't parse date - include it to be safe
-                                    all_reviews_html.append(review_html)
-                                    reviews_added += 1
-                            else:
-                                # No date filter - add all reviews
-                                all_reviews_html.append(review_html)
-                                reviews_added += 1
-                            
-                            # If we found an old review, stop checking remaining reviews on this page
-                            if should_stop:
-                                break
-                        
-                        if reviews_added > 0 and not should_stop:
-                            print(f"      ✅ Found {len(review_containers)} reviews, added {reviews_added} (within date range)")
-                            consecutive_empty_pages = 0  # Reset counter
-                            pages_loaded_count += 1
-                        elif should_stop:
-                            print(f"      ⏹️  Stopped after checking {reviews_added + 1} review(s) - found old review")
+                    try:
+                        # Only the review cards of extra pages are needed - skip building the rest of the tree
+                        page_html = page_html or fetcher.fetch(page_url)
+                        page_soup = BeautifulSoup(page_html, HTML_PARSER, parse_only=_REVIEW_STRAINER)
+                        review_tags, should_stop = _scan_page(page_soup, cutoff_date, days_back)
+                        all_review_tags.extend(review_tags)
                         
                         # Stop loading more pages if we found an old review
                         if should_stop:
                             print(f"      ✅ Reached date limit - stopping pagination")
                             should_stop_main = True
-                            break  # Exit while loop - don't try next page
-                        
-                        page_num += 1
-                    else:
-                        # Check for "no reviews" message or similar
-                        page_text = page_soup.get_text().lower()
-                        if 'no reviews' in page_text or 'no more reviews' in page_text:
-                            print(f"      ℹ️  Page {page_num} indicates no more reviews - stopping")
-                            break
+                            break  # Exit page loop - don't try next page
                         
+                        if review_tags:
+                            consecutive_empty_pages = 0  # Reset counter
+                            pages_loaded_count += 1
+                            page_num += 1
+                        else:
+                            # Check for "no reviews" message or similar (stops at the first matching text node)
+                            # - needs the full page, so parse it unstrained (only for empty pages)
+                            if BeautifulSoup(page_html, HTML_PARSER).find(string=_NO_REVIEWS_RE):
+                                print(f"      ℹ️  Page {page_num} indicates no more reviews - stopping")
+                                stop_loading = True
+                                break
+                            
+                            consecutive_empty_pages += 1
+                            print(f"      ⚠️  No reviews found on page {page_num} ({consecutive_empty_pages}/{max_empty_pages})")
+                            
+                            if consecutive_empty_pages >= max_empty_pages:
+                                print(f"      ✅ Reached end of reviews (no reviews for {max_empty_pages} consecutive pages)")
+                                break
+                            
+                            page_num += 1
+                            
+                    except Exception as e:
+                        print(f"      ❌ Error loading page {page_num}: {e}")
                         consecutive_empty_pages += 1
-                        print(f"      ⚠️  No reviews found on page {page_num} ({consecutive_empty_pages}/{max_empty_pages})")
-                        
                         if consecutive_empty_pages >= max_empty_pages:
-                            print(f"      ✅ Reached end of reviews (no reviews for {max_empty_pages} consecutive pages)")
                             break
-                        
                         page_num += 1
-                        
-                except Exception as e:
-                    print(f"      ❌ Error loading page {page_num}: {e}")
-                    consecutive_empty_pages += 1
-                    if consecutive_empty_pages >= max_empty_pages:
-                        break
-                    page_num += 1
+                
+                window_size = min(window_size * 2, _page_fetch_workers)
         
         # Combine all reviews into main HTML
-        if all_reviews_html:
-            print(f"\n📝 Combining {len(all_reviews_html)} additional reviews into HTML...")
+        if all_review_tags:
+            print(f"\n📝 Combining {len(all_review_tags)} additional reviews into HTML...")
             
-            # Find the reviews container in main HTML - try multiple selectors
+            # Find the reviews container in main HTML - one CSS pass over the page,
+            # then take the match of the highest-priority selector
             reviews_section = None
-            
-            # Try different ways to find the reviews container
-            selectors = [
-                ('div', {'class': 'reviews'}),
-                ('div', {'class': lambda x: x and 'review' in x.lower()}),
-                ('section', {'class': 'review-section'}),
-                ('div', {'id': 'reviews'}),
-                ('div', {'class': 'review-body'}),
-            ]
-            
-            for tag, attrs in selectors:
-                reviews_section = main_soup.find(tag, attrs)
+            candidates = main_soup.select(', '.join(_REVIEWS_CONTAINER_SELECTORS))
+            for selector in _REVIEWS_CONTAINER_SELECTORS:
+                reviews_section = next((c for c in candidates if c.css.match(selector)), None)
                 if reviews_section:
                     break
             
-            # If still not found, look for any div containing client-review
-            if not reviews_section:
-                existing_reviews = main_soup.find_all('div', class_='client-review')
-                if existing_reviews:
-                    # Find parent container of existing reviews
-                    reviews_section = existing_reviews[0].find_parent('div', class_=lambda x: x and ('review' in str(x).lower() or 'reviews' in str(x).lower()))
-            
             if reviews_section:
                 # Append all additional reviews
-                for review_html in all_reviews_html:
-                    review_soup = BeautifulSoup(review_html, 'html.parser')
-                    review_div = review_soup.find('div', class_='client-review')
-                    if review_div:
-                        reviews_section.append(review_div)
+                for review_tag in all_review_tags:
+                    reviews_section.append(review_tag)
                 
-                # Update the HTML content
-                html_content = str(main_soup)
                 print(f"   ✅ Combined all reviews into HTML")
             else:
                 # If we can't find the container, append to body as fallback
                 print(f"   ⚠️  Could not find reviews section, appending to body")
                 body = main_soup.find('body')
                 if body:
-                    for review_html in all_reviews_html:
-                        review_soup = BeautifulSoup(review_html, 'html.parser')
-                        body.append(review_soup)
-                    html_content = str(main_soup)
-                else:
-                    html_content = driver.page_source
-        
-        # Get final HTML content (use main page if no additional reviews)
-        if not all_reviews_html:
-            html_content = driver.page_source
+                    for review_tag in all_review_tags:
+                        body.append(review_tag)
         
         # Final pass: Filter out old reviews from the final HTML if date filter is enabled
+        # (the same review list also gives the final review count - no second traversal)
+        all_reviews = main_soup.find_all('div', class_='client-review')
+        removed_count = 0
         if cutoff_date:
-            print(f"\n🔍 Final filtering pass: Removing reviews older than {days_back} days...")
-            final_soup = BeautifulSoup(html_content, 'html.parser')
-            all_reviews = final_soup.find_all('div', class_='client-review')
-            removed_count = 0
-            
-            for review in all_reviews:
-                review_date = extract_review_date_from_html(str(review))
-                if review_date:
-                    if review_date < cutoff_date:
-                        # Review is too old - remove it
-                        review.decompose()
-                        removed_count += 1
+            # Reviews from extra pages were checked in _scan_page() - only the rest need their date parsed
+            checked_reviews.update(map(id, all_review_tags))
+            unchecked_reviews = [review for review in all_reviews if id(review) not in checked_reviews]
             
-            if removed_count > 0:
-                print(f"   ✅ Removed {removed_count} old review(s) from final HTML")
-                html_content = str(final_soup)
+            if not unchecked_reviews:
+                # Every review was kept by the main page / pagination checks (no old review left behind)
+                print(f"\n✅ Pagination already respected the cutoff - skipping final filter")
             else:
-                print(f"   ✅ All reviews are within date range")
+                print(f"\n🔍 Final filtering pass: Removing reviews older than {days_back} days...")
+                for review in unchecked_reviews:
+                    review_date = extract_review_date_from_tag(review)
+                    if review_date:
+                        if review_date < cutoff_date:
+                            # Review is too old - remove it
+                            review.decompose()
+                            removed_count += 1
+                
+                if removed_count > 0:
+                    print(f"   ✅ Removed {removed_count} old review(s) from final HTML")
+                else:
+                    print(f"   ✅ All reviews are within date range")
         
         # Extract user ID for filename
-        match = re.search(r'/attorneys/([^/]+)\.html', base_url)
+        match = _USER_ID_RE.search(base_url)
         if match:
             user_id = match.group(1)
         else:
@@ -676,15 +931,14 @@ def scrape_and_convert_to_csv(url, days_back=None, save_html=False):
         # Optionally save HTML (for debugging)
         if save_html:
             html_filename = f"{user_id}.html"
-            with open(html_filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            with open(html_filename, 'wb', buffering=1 << 20) as f:
+                f.write(main_soup.encode('utf-8'))
             print(f"💾 HTML saved to: {html_filename}")
         
         # Count total reviews in final HTML
-        final_soup = BeautifulSoup(html_content, 'html.parser')
-        total_reviews = len(final_soup.find_all('div', class_='client-review'))
+        total_reviews = len(all_reviews) - removed_count
         
-        # Extract data directly from HTML
+        # Extract data directly from the parsed page
         print(f"\n📊 Extracting data from HTML...")
         # Create filter info string for CSV
         csv_filter_info = None
@@ -693,7 +947,7 @@ def scrape_and_convert_to_csv(url, days_back=None, save_html=False):
         else:
             csv_filter_info = "All reviews (no date filter)"
         
-        data, reviews = extract_profile_data_from_html(html_content, review_date_filter=csv_filter_info)
+        data, reviews = extract_profile_data_from_soup(main_soup, review_date_filter=csv_filter_info)
         
         if not data:
             print("❌ Failed to extract data")
@@ -707,11 +961,13 @@ def scrape_and_convert_to_csv(url, days_back=None, save_html=False):
         print(f"Total review pages loaded: {pages_loaded_count}")
         print(f"Total reviews found: {total_reviews}")
         print(f"Total reviews extracted: {len(reviews)}")
-        print(f"HTML length: {len(html_content)} characters")
         
-        # Close browser
-        driver.quit()
-        print("\n✅ Browser closed successfully")
+        # Close browser (a shared driver is closed by the caller after the batch)
+        if owns_driver:
+            driver.quit()
+            print("\n✅ Browser closed successfully")
+        else:
+            _reset_driver(driver)
         
         # Return data and reviews instead of saving here
         return (data, reviews)
@@ -720,15 +976,204 @@ def scrape_and_convert_to_csv(url, days_back=None, save_html=False):
         print(f"❌ Error occurred: {e}")
         import traceback
         traceback.print_exc()
-        if driver:
+        if owns_driver and driver:
             try:
                 driver.quit()
             except:
                 pass
+        elif driver:
+            _reset_driver(driver)
         return None
 
 
+def _backoff_delay(consecutive_failures):
+    """
+    Seconds to wait before the next URL after consecutive failures
+    (none for the first few, then 1, 2, 4 ... minutes, capped at 32 minutes)
+    """
+    if consecutive_failures < BACKOFF_AFTER_FAILURES:
+        return 0
+    return 60 * 2 ** min(consecutive_failures - BACKOFF_AFTER_FAILURES, 5)
+
+
+def _print_circuit_break(consecutive_failures):
+    """Message shown when the batch stops early because too many URLs failed in a row"""
+    print(f"\n⛔ {consecutive_failures} URLs failed in a row - Avvo is probably blocking requests.")
+    print(f"   Stopping the batch early. Rows of the URLs processed so far are saved.")
+
+
+# Chrome session of a URL worker process (started on its first URL, reused for the rest)
+_worker_driver = None
+
+
+def _init_url_worker(page_fetch_workers):
+    """
+    URL worker process initializer
+    
+    Args:
+        page_fetch_workers: This process's share of PAGE_FETCH_WORKERS
+    """
+    global _page_fetch_workers
+    _page_fetch_workers = page_fetch_workers
+    # Close this worker's browser when the pool shuts the process down
+    multiprocessing.util.Finalize(None, _quit_worker_driver, exitpriority=10)
+
+
+def _quit_worker_driver():
+    """
+    Quit this worker process's browser (if one is running)
+    """
+    global _worker_driver
+    if _worker_driver is not None:
+        try:
+            _worker_driver.quit()
+        except:
+            pass
+        _worker_driver = None
+
+
+def _scrape_url_in_worker(i, total, url, days_back):
+    """
+    URL worker task: scrape one URL with this process's browser
+    (the rows are written by the main process, so the CSV has a single writer; console output
+    is captured and printed by the main process too, so parallel URLs don't interleave)
+    
+    Args:
+        i: Position of the URL in the batch (1-based, for messages)
+        total: Number of URLs in the batch
+        url: Avvo profile URL
+        days_back: Number of days to look back for reviews (None = all reviews)
+    
+    Returns:
+        Tuple of ((data, reviews) or None if failed, captured output)
+    """
+    global _worker_driver
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        if _worker_driver is None:
+            print("Starting undetected Chrome browser...")
+            try:
+                _worker_driver = init_chrome_driver(user_multi_procs=True)
+            except Exception as e:
+                print(f"❌ Could not start Chrome: {e}")
+                return None, buffer.getvalue()
+        
+        # Small random pause so the workers don't all hit Avvo at the same moment
+        time.sleep(random.uniform(*URL_START_JITTER))
+        
+        print(f"\n{'='*80}")
+        print(f"[{i}/{total}] Processing URL: {url}")
+        print(f"{'='*80}")
+        
+        result = scrape_and_convert_to_csv(url, days_back, save_html=False, driver=_worker_driver)
+        
+        # A dead browser session would fail every later URL of this worker - start a new one next time
+        if not result and not _driver_alive(_worker_driver):
+            print("🔄 Browser session was lost - a new one is started for the next URL")
+            _quit_worker_driver()
+    return result, buffer.getvalue()
+
+
+def run_urls_in_parallel(urls, days_back, output_csv_path, max_workers=URL_WORKERS):
+    """
+    Scrape URLs in worker processes (one Chrome each) and write all rows to one CSV
+    Results are written in URL order by this process as they become available
+    At most max_workers URLs run at once - a new one starts as soon as a worker is free, after the
+    same backoff wait as the one-browser loop when URLs keep failing
+    After too many failures in a row no more URLs are started; the ones already running are still saved
+    Call prepare_chromedriver() first - the workers' browsers share its patched chromedriver
+    
+    Args:
+        urls: List of Avvo profile URLs
+        days_back: Number of days to look back for reviews (None = all reviews)
+        output_csv_path: Path to output CSV file
+        max_workers: Number of worker processes
+    
+    Returns:
+        Tuple of (successful count, failed count)
+    """
+    successful = 0
+    failed = 0
+    
+    print(f"🚀 Processing with {max_workers} parallel browser(s)...")
+    # Review pages are downloaded by all workers at once - split the budget between them
+    page_fetch_workers = max(1, PAGE_FETCH_WORKERS // max_workers)
+    # URLs may run ahead of the oldest unfinished one by this much (bounds the reorder buffer)
+    max_ahead = max_workers * 2
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_url_worker,
+                             initargs=(page_fetch_workers,)) as executor, CsvSink(output_csv_path) as sink:
+        running = {}  # Future -> index of its URL
+        finished = {}  # URL index -> (result, output, error) waiting for the earlier URLs
+        next_index = 0  # Index of the next URL to start
+        next_release = 0  # Index of the next URL to print and save
+        consecutive_failures = 0
+        stopped = False
+        
+        def start_next_url():
+            nonlocal next_index
+            future = executor.submit(_scrape_url_in_worker, next_index + 1, len(urls), urls[next_index], days_back)
+            running[future] = next_index
+            next_index += 1
+        
+        while next_index < len(urls) and len(running) < max_workers:
+            start_next_url()
+        
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                try:
+                    result, output = future.result()
+                    finished[index] = (result, output, None)
+                except Exception as e:
+                    finished[index] = (None, '', e)
+            
+            # Print and save the results that are next in URL order
+            while next_release in finished:
+                result, output, error = finished.pop(next_release)
+                next_release += 1
+                print(output, end='')
+                if error is not None:
+                    print(f"❌ Error processing URL {next_release}/{len(urls)}: {error}")
+                elif not result:
+                    print(f"❌ Failed to process URL {next_release}/{len(urls)}")
+                
+                if result:
+                    data, reviews = result
+                    print(f"\n💾 Saving to CSV: {output_csv_path}")
+                    sink.write_profile(data, reviews)
+                    successful += 1
+                    consecutive_failures = 0
+                    print(f"✅ Successfully processed URL {next_release}/{len(urls)}")
+                else:
+                    failed += 1
+                    consecutive_failures += 1
+                
+                # Give up when Avvo keeps failing - probably rate limiting or blocking
+                if not stopped and next_index < len(urls) and consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                    _print_circuit_break(consecutive_failures)
+                    # Start no more URLs (the ones still running are collected and saved)
+                    stopped = True
+            
+            # Start new URLs on the free workers
+            while (not stopped and next_index < len(urls) and len(running) < max_workers
+                   and next_index - next_release < max_ahead):
+                # Back off when Avvo keeps failing (and then start one URL per collected result)
+                delay = _backoff_delay(consecutive_failures)
+                if delay:
+                    print(f"\n⏸️  {consecutive_failures} URLs failed in a row - waiting {delay} seconds before the next one...")
+                    time.sleep(delay)
+                start_next_url()
+                if delay:
+                    break
+    
+    return successful, failed
+
+
 if __name__ == "__main__":
+    # Needed for worker processes in the PyInstaller-built executable
+    multiprocessing.freeze_support()
+    
     print("\n" + "="*80)
     print("AVVO PROFILE SCRAPER - BATCH PROCESSING")
     print("="*80)
@@ -764,33 +1209,75 @@ if __name__ == "__main__":
     
     successful = 0
     failed = 0
-    is_first_url = True
     
-    for i, url in enumerate(urls, 1):
-        print(f"\n{'='*80}")
-        print(f"[{i}/{len(urls)}] Processing URL: {url}")
-        print(f"{'='*80}")
-        
+    # Parallel browsers need the chromedriver binary patched up front (else: one browser, one URL at a time)
+    if URL_WORKERS > 1 and len(urls) > 1 and prepare_chromedriver():
+        successful, failed = run_urls_in_parallel(urls, DAYS_BACK, OUTPUT_CSV)
+    else:
+        # One browser session for the whole batch (avoids Chrome startup + Cloudflare warm-up per URL)
+        print("Starting undetected Chrome browser...")
         try:
-            result = scrape_and_convert_to_csv(url, DAYS_BACK, save_html=False)
-            
-            if result:
-                data, reviews = result
-                # Save to CSV (append mode)
-                print(f"\n💾 Saving to CSV: {OUTPUT_CSV}")
-                save_to_csv_append(data, reviews, OUTPUT_CSV, is_first_url=is_first_url)
-                is_first_url = False
-                successful += 1
-                print(f"✅ Successfully processed URL {i}/{len(urls)}")
-            else:
-                failed += 1
-                print(f"❌ Failed to process URL {i}/{len(urls)}")
-        
+            driver = init_chrome_driver()
         except Exception as e:
-            failed += 1
-            print(f"❌ Error processing URL {i}/{len(urls)}: {e}")
-            import traceback
-            traceback.print_exc()
+            driver = None
+            failed = len(urls)
+            print(f"❌ Could not start Chrome: {e}")
+        
+        if driver:
+            # One CSV file for the whole batch, kept open until all URLs are processed
+            try:
+                with CsvSink(OUTPUT_CSV) as sink:
+                    consecutive_failures = 0
+                    for i, url in enumerate(urls, 1):
+                        # Back off (or give up) when Avvo keeps failing - probably rate limiting or blocking
+                        if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+                            _print_circuit_break(consecutive_failures)
+                            break
+                        delay = _backoff_delay(consecutive_failures)
+                        if delay:
+                            print(f"\n⏸️  {consecutive_failures} URLs failed in a row - waiting {delay} seconds before the next one...")
+                            time.sleep(delay)
+                        
+                        print(f"\n{'='*80}")
+                        print(f"[{i}/{len(urls)}] Processing URL: {url}")
+                        print(f"{'='*80}")
+                        
+                        try:
+                            result = scrape_and_convert_to_csv(url, DAYS_BACK, save_html=False, driver=driver)
+                            
+                            if result:
+                                data, reviews = result
+                                # Save to CSV
+                                print(f"\n💾 Saving to CSV: {OUTPUT_CSV}")
+                                sink.write_profile(data, reviews)
+                                successful += 1
+                                consecutive_failures = 0
+                                print(f"✅ Successfully processed URL {i}/{len(urls)}")
+                            else:
+                                failed += 1
+                                consecutive_failures += 1
+                                print(f"❌ Failed to process URL {i}/{len(urls)}")
+                        
+                        except Exception as e:
+                            failed += 1
+                            consecutive_failures += 1
+                            print(f"❌ Error processing URL {i}/{len(urls)}: {e}")
+                            import traceback
+                            traceback.print_exc()
+                        
+                        # A dead browser session would fail every later URL too - replace it before the next one
+                        if consecutive_failures and not _driver_alive(driver):
+                            driver = _restart_driver(driver)
+                            if driver is None:
+                                break
+            finally:
+                # Close browser once after the whole batch
+                if driver:
+                    try:
+                        driver.quit()
+                        print("\n✅ Browser closed successfully")
+                    except:
+                        pass
     
     # Final summary
     print("\n" + "="*80)
@@ -799,6 +1286,8 @@ if __name__ == "__main__":
     print(f"✅ Successfully processed: {successful} URL(s)")
     if failed > 0:
         print(f"❌ Failed: {failed} URL(s)")
+    if successful + failed < len(urls):
+        print(f"⏭️  Skipped: {len(urls) - successful - failed} URL(s) (stopped after repeated failures or a lost browser)")
     print(f"📄 Output CSV: {OUTPUT_CSV}")
     print("="*80 + "\n")
 
@@ -2,31 +2,134 @@
 HTML to CSV Converter for Avvo Profile Pages
 Extracts attorney profile information from HTML and saves to CSV
 """
-from bs4 import BeautifulSoup
-import pandas as pd
+from bs4 import BeautifulSoup, SoupStrainer, NavigableString
 import re
 from datetime import datetime
 import sys
 import os
 import json
 import csv
+import io
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
+from functools import lru_cache
 
+# Number of HTML files converted in parallel when processing a whole folder (1 = one at a time)
+FILE_WORKERS = os.cpu_count() or 1
 
-def extract_profile_data_from_html(html_content):
+# HTML parser for BeautifulSoup - lxml (C-based) is much faster than the built-in html.parser
+# Falls back to html.parser if lxml is not installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# JSON decoder for the payload / JSON-LD blocks - orjson is faster when installed
+# Falls back to json.loads (also for the few inputs orjson rejects, e.g. NaN)
+try:
+    import orjson
+    
+    def _loads(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return json.loads(text)
+except ImportError:
+    _loads = json.loads
+
+# Precompiled regex patterns (avoids re-compiling / cache lookups on every profile)
+_RE_NOMEN = re.compile(r'/attorneys/([^/]+)\.html')
+_RE_STATE_ZIP = re.compile(r'([A-Z]{2})\s*,?\s*(\d{5}(?:-\d{4})?)?')
+_RE_CLIENT_REVIEWS = re.compile(r'(\d+)\s+Client Reviews')
+_RE_PAREN_NUM = re.compile(r'\((\d+)\)')
+_RE_RATING = re.compile(r'Rating:\s*([\d.]+)')
+_RE_LICENSED = re.compile(r'Licensed for (\d+) years')
+_RE_EXPAND = re.compile(r'expanded|expand', re.IGNORECASE)
+_RE_LAWYER_HREF = re.compile(r'/.*-lawyer/')
+_RE_LAWYER = re.compile(r'lawyer')
+_RE_PRACTICE_AREAS = re.compile(r'Practice Areas', re.IGNORECASE)
+_RE_LEADING_PCT = re.compile(r'^\d+\s*%?\s*')
+_RE_TRAILING_PCT = re.compile(r'\s*%$')
+_RE_FREE_CONSULT = re.compile(r'Free Consultation')
+_RE_VIRTUAL_CONSULT = re.compile(r'Virtual Consultation Available', re.IGNORECASE)
+_RE_VIRTUAL = re.compile(r'Virtual', re.IGNORECASE)
+_RE_CONTINGENCY = re.compile(r'Contingency')
+_RE_PCT_NUM = re.compile(r'(\d+)%')
+_RE_DOLLAR_NUM = re.compile(r'\$(\d+)')
+_RE_WS = re.compile(r'\s+')
+_RE_HEADSHOT_ALT = re.compile(r'headshot', re.IGNORECASE)
+_RE_HEADSHOT_SRC = re.compile(r'head_shot', re.IGNORECASE)
+_RE_FLEX_COL = re.compile(r'flex-direction: column')
+_RE_POSTED_BY = re.compile(r'Posted by (.+?)\s*\|\s*(.+?)(?:\s*\|)?$')
+_RE_REPLIED_LAST = re.compile(r'Replied last (.+)', re.IGNORECASE)
+_RE_DATE = re.compile(r'^(?:([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4})|(\d{1,2})/(\d{1,2})/(\d{4}))$')
+
+# Month names for review dates, lowercased ("february" and "feb" -> 2)
+_MONTH_NAMES = ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+                'august', 'september', 'october', 'november', 'december']
+_MONTHS = {name: num for num, name in enumerate(_MONTH_NAMES, 1)}
+_MONTHS.update({name[:3]: num for num, name in enumerate(_MONTH_NAMES, 1)})
+_DATE_FORMATS = ('%B %d, %Y', '%b %d, %Y', '%m/%d/%Y', '%B %d,%Y')
+
+# Review content spans that are UI chrome, not review text
+_REVIEW_TEXT_SKIP = frozenset(['...', '…', 'See Full Review'])
+
+# Free-text CSV columns whose newlines and runs of spaces are collapsed before writing
+_CSV_TEXT_FIELDS = ('review_text', 'review_title', 'attorney_response_text', 'biography', 'company_address',
+                    'education', 'bar_admissions', 'honors_awards', 'associations',
+                    'work_experience', 'practice_areas', 'additional_practice_areas',
+                    'practice_area_percentages', 'cost_details', 'retainer_info',
+                    'payment_methods', 'license_details')
+
+
+# Top-level tags that never hold profile data - skipped while parsing
+# html/head are not kept as containers, so their children are checked one by one;
+# <body> is kept whole, so loose text in it stays in the tree
+_SKIP_TAGS = frozenset(['html', 'head', 'style', 'noscript', 'svg', 'iframe', 'meta', 'title'])
+
+
+def _keep_tag(name, attrs=None):
     """
-    Extract all profile data from Avvo HTML content (string)
+    SoupStrainer filter: keep every top-level subtree except styles/meta/etc.
+    Decides on the tag name only - beautifulsoup4 < 4.13 passes (name, attrs), newer versions
+    only the name - so scripts are removed before parsing instead (see _RE_SKIP_BLOCKS)
+    """
+    return name not in _SKIP_TAGS
+
+
+PROFILE_STRAINER = SoupStrainer(_keep_tag)
+
+# Script (except JSON-LD) / style / noscript blocks - cut out of the markup before it is parsed
+# (same result on every beautifulsoup4 version and parser, and the parser never sees the script bodies)
+_RE_SKIP_BLOCKS = re.compile(
+    r'<script\b(?![^>]*application/ld\+json)[^>]*>.*?</script\s*>'
+    r'|<style\b[^>]*>.*?</style\s*>'
+    r'|<noscript\b[^>]*>.*?</noscript\s*>',
+    re.IGNORECASE | re.DOTALL)
+_RE_SKIP_BLOCKS_BYTES = re.compile(_RE_SKIP_BLOCKS.pattern.encode('ascii'), re.IGNORECASE | re.DOTALL)
+
+
+def make_profile_soup(html_content):
+    """
+    Parse a profile page with the fastest available parser
+    Scripts (except JSON-LD), styles and noscript blocks are cut out first, and only the
+    top-level subtrees that can hold profile data are built (see _keep_tag)
+    Bytes are decoded as UTF-8 directly (skips encoding detection)
     
     Args:
-        html_content: HTML content as string
+        html_content: HTML as string or UTF-8 bytes
         
     Returns:
-        Tuple of (data dictionary, reviews list)
+        BeautifulSoup object
     """
-    # Use html.parser (built-in) instead of lxml
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # Continue with extraction logic (same as below)
-    return _extract_data_from_soup(soup)
+    if isinstance(html_content, bytes):
+        html_content = _RE_SKIP_BLOCKS_BYTES.sub(b'', html_content)
+        return BeautifulSoup(html_content, HTML_PARSER, from_encoding='utf-8', parse_only=PROFILE_STRAINER)
+    html_content = _RE_SKIP_BLOCKS.sub('', html_content)
+    return BeautifulSoup(html_content, HTML_PARSER, parse_only=PROFILE_STRAINER)
 
 
 def extract_profile_data(html_file_path):
@@ -40,7 +143,8 @@ def extract_profile_data(html_file_path):
         Tuple of (data dictionary, reviews list)
     """
     try:
-        with open(html_file_path, 'r', encoding='utf-8') as f:
+        # Read raw bytes - the parser decodes them as UTF-8 directly (no str copy, no sniffing)
+        with open(html_file_path, 'rb') as f:
             html_content = f.read()
     except FileNotFoundError:
         print(f"❌ Error: File '{html_file_path}' not found!")
@@ -57,17 +161,414 @@ def extract_profile_data_from_html(html_content, review_date_filter=None):
     Extract all profile data from Avvo HTML content (string)
     
     Args:
-        html_content: HTML content as string
+        html_content: HTML content as string (or UTF-8 bytes)
         review_date_filter: Optional string describing the review date filter applied (e.g., "Last 365 days (from 2024-12-27)" or "All reviews (no date filter)")
         
     Returns:
         Tuple of (data dictionary, reviews list)
     """
-    # Use html.parser (built-in) instead of lxml
-    soup = BeautifulSoup(html_content, 'html.parser')
+    soup = make_profile_soup(html_content)
     return _extract_data_from_soup(soup, review_date_filter)
 
 
+def extract_profile_data_from_soup(soup, review_date_filter=None):
+    """
+    Extract all profile data from an already parsed Avvo page
+    (skips serializing the page back to a string and parsing it again)
+    
+    Args:
+        soup: BeautifulSoup object of the profile page
+        review_date_filter: Optional string describing the review date filter applied
+        
+    Returns:
+        Tuple of (data dictionary, reviews list)
+    """
+    return _extract_data_from_soup(soup, review_date_filter)
+
+
+def _build_index(soup):
+    """
+    Index every tag by class and by id in a single pass over the tree
+    The same pass also buckets the few non-class lookups the extractor needs:
+        'tel'              - <a href="tel:...">
+        'practice_area'    - <a> whose href matches /...-lawyer/
+        'msg'              - <a data-pp="msg_initiated">
+        'directions'       - <a> whose own text mentions "Get Directions"
+        'directions_label' - <a aria-label="Get Directions"> (any case)
+        'canonical'        - <link rel="canonical">
+        'ld_json'          - <script type="application/ld+json">
+        'headshot_alt'     - <img> with "headshot" in alt
+        'headshot_src'     - <img> with "head_shot" in src
+    
+    Args:
+        soup: BeautifulSoup object
+        
+    Returns:
+        Tuple of (class -> list of tags in document order, id -> first tag with that id,
+                  bucket name -> list of tags in document order)
+    """
+    class_index = {}
+    id_index = {}
+    tag_index = {'tel': [], 'practice_area': [], 'msg': [], 'directions': [], 'directions_label': [],
+                 'canonical': [], 'ld_json': [], 'headshot_alt': [], 'headshot_src': []}
+    for tag in soup.find_all(True):
+        attrs = tag.attrs
+        classes = attrs.get('class')
+        if classes:
+            for class_name in dict.fromkeys(classes):
+                class_index.setdefault(class_name, []).append(tag)
+        tag_id = attrs.get('id')
+        if tag_id and tag_id not in id_index:
+            id_index[tag_id] = tag
+        name = tag.name
+        if name == 'a':
+            href = attrs.get('href')
+            if href:
+                if href.startswith('tel:'):
+                    tag_index['tel'].append(tag)
+                if '-lawyer/' in href and _RE_LAWYER_HREF.search(href):
+                    tag_index['practice_area'].append(tag)
+            if attrs.get('data-pp') == 'msg_initiated':
+                tag_index['msg'].append(tag)
+            if _mentions_get_directions(tag.string):
+                tag_index['directions'].append(tag)
+            label = attrs.get('aria-label')
+            if label and label.lower() == 'get directions':
+                tag_index['directions_label'].append(tag)
+        elif name == 'img':
+            alt = attrs.get('alt')
+            if alt and _RE_HEADSHOT_ALT.search(alt):
+                tag_index['headshot_alt'].append(tag)
+            src = attrs.get('src')
+            if src and _RE_HEADSHOT_SRC.search(src):
+                tag_index['headshot_src'].append(tag)
+        elif name == 'script':
+            if attrs.get('type') == 'application/ld+json':
+                tag_index['ld_json'].append(tag)
+        elif name == 'link':
+            if 'canonical' in (attrs.get('rel') or ()):
+                tag_index['canonical'].append(tag)
+    return class_index, id_index, tag_index
+
+
+def _find_indexed(class_index, name, class_name):
+    """
+    Same result as soup.find(name, class_=class_name), looked up from the class index
+    A class_name with spaces must match the whole class attribute (like BeautifulSoup)
+    """
+    if ' ' in class_name:
+        for tag in class_index.get(class_name.split()[0], ()):
+            if tag.name == name and ' '.join(tag['class']) == class_name:
+                return tag
+        return None
+    for tag in class_index.get(class_name, ()):
+        if tag.name == name:
+            return tag
+    return None
+
+
+def _find_all_by_class(root, name, class_name):
+    """
+    Same result as root.find_all(name, class_=class_name) for a single class name,
+    using a plain name/class test instead of BeautifulSoup's generic attribute matcher
+    """
+    return [tag for tag in root.descendants
+            if tag.name == name and class_name in (tag.get('class') or ())]
+
+
+def _count_stars(container, limit=5):
+    """
+    Count the <i class="icon-star-yellow"> icons below container without building a list
+    Stops once limit stars are found (ratings go up to 5), skipping the rest of the review
+    """
+    count = 0
+    for tag in container.descendants:
+        if tag.name == 'i' and 'icon-star-yellow' in (tag.get('class') or ()):
+            count += 1
+            if count >= limit:
+                break
+    return count
+
+
+def _practice_area_title(pa_div):
+    """
+    Same result as pa_div.find('div', class_='practice-area-title') or pa_div.find('a', class_='practice-area-title'),
+    in one walk that stops at the first matching <div> (an earlier matching <a> is kept as the fallback)
+    """
+    first_link = None
+    for tag in pa_div.descendants:
+        name = tag.name
+        if (name == 'div' or name == 'a') and 'practice-area-title' in (tag.get('class') or ()):
+            if name == 'div':
+                return tag
+            if first_link is None:
+                first_link = tag
+    return first_link
+
+
+def _scan_fees_section(fees_section):
+    """
+    One walk of the fees section for the three tags the fees extraction starts from
+    Same results as fees_section.find('strong', string=_mentions_retainer), .find('ul')
+    and .find('h4', string=_mentions_cost); stops once all three are found
+    
+    Returns:
+        Tuple of (retainer <strong>, payment <ul>, cost <h4>) - each may be None
+    """
+    retainer_elem = payment_ul = cost_h4 = None
+    for tag in fees_section.descendants:
+        name = tag.name
+        if name == 'strong':
+            if retainer_elem is None and _mentions_retainer(tag.string):
+                retainer_elem = tag
+        elif name == 'ul':
+            if payment_ul is None:
+                payment_ul = tag
+        elif name == 'h4':
+            if cost_h4 is None and _mentions_cost(tag.string):
+                cost_h4 = tag
+        else:
+            continue
+        if retainer_elem is not None and payment_ul is not None and cost_h4 is not None:
+            break
+    return retainer_elem, payment_ul, cost_h4
+
+
+def _find_by_id(id_index, name, tag_id):
+    """
+    Same result as soup.find(name, id=tag_id) when ids are unique, looked up from the id index
+    """
+    tag = id_index.get(tag_id)
+    if tag is not None and tag.name == name:
+        return tag
+    return None
+
+
+def _text(elem):
+    """
+    Same as elem.get_text(strip=True), but reads .string directly for leaf tags
+    (a tag with one text child) instead of walking all descendants
+    """
+    string = elem.string
+    if type(string) is NavigableString:
+        return string.strip()
+    return elem.get_text(strip=True)
+
+
+# string= filters for plain case-insensitive substring tests (no regex engine per text node)
+def _mentions_retainer(string):
+    return bool(string) and 'retainer' in string.lower()
+
+
+def _mentions_cost(string):
+    return bool(string) and 'cost' in string.lower()
+
+
+def _mentions_get_directions(string):
+    return bool(string) and 'get directions' in string.lower()
+
+
+@lru_cache(maxsize=4096)
+def _parse_review_date(date_str):
+    """
+    Parse a review / reply date ("August 3, 2025", "Aug 3, 2025", "8/3/2025")
+    One regex match plus a month lookup; strptime is only tried for other shapes
+    Cached - the same dates repeat across reviews and across files in a batch
+    
+    Args:
+        date_str: Date text from the review header or attorney reply
+        
+    Returns:
+        Date as 'YYYY-MM-DD' string, or None if it can't be parsed
+    """
+    match = _RE_DATE.match(date_str)
+    if match:
+        if match.group(1):
+            month = _MONTHS.get(match.group(1).lower())
+            day, year = match.group(2), match.group(3)
+        else:
+            month, day, year = int(match.group(4)), match.group(5), match.group(6)
+        if month:
+            try:
+                parsed = datetime(int(year), month, int(day))
+            except ValueError:
+                return None
+            return '%04d-%02d-%02d' % (parsed.year, parsed.month, parsed.day)
+    
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+    return None
+
+
+def _in_tooltip(elem, container):
+    """
+    True if elem sits inside a div.tooltip below container
+    (stops at the review container instead of walking up to the document root)
+    """
+    for parent in elem.parents:
+        if parent is container:
+            return False
+        if parent.name == 'div' and 'tooltip' in (parent.get('class') or ()):
+            return True
+    return False
+
+
+def _parse_state_zip(last_part):
+    """
+    Split the "TX 78701" / "TX 78701-1234" / "TX" tail of an address into state and zip
+    Plain string checks cover the usual formats; anything else goes through _RE_STATE_ZIP
+    
+    Args:
+        last_part: Address text after the last comma
+        
+    Returns:
+        Tuple of (state, zip) - either may be None
+    """
+    tokens = last_part.split()
+    if 1 <= len(tokens) <= 2 and last_part.isascii():
+        state = tokens[0]
+        if len(state) == 2 and state.isalpha() and state.isupper():
+            if len(tokens) == 1:
+                return state, None
+            zip_code = tokens[1]
+            if (len(zip_code) == 5 and zip_code.isdigit()) or \
+               (len(zip_code) == 10 and zip_code[5] == '-' and zip_code[:5].isdigit() and zip_code[6:].isdigit()):
+                return state, zip_code
+    
+    state_zip = _RE_STATE_ZIP.match(last_part)
+    if state_zip:
+        return state_zip.group(1), state_zip.group(2)
+    return None, None
+
+
+def _find_local_business(ld_json_scripts):
+    """
+    Find the first LocalBusiness entity in the page's JSON-LD scripts
+    Each distinct script body is parsed once; list and @graph blocks are flattened
+    
+    Args:
+        ld_json_scripts: <script type="application/ld+json"> tags, in document order
+        
+    Returns:
+        The LocalBusiness dictionary, or None
+    """
+    seen = set()
+    for script in ld_json_scripts:
+        content = script.string
+        if not content or content in seen:  # Empty script or same block already parsed
+            continue
+        seen.add(content)
+        try:
+            json_data = _loads(content)
+        except (ValueError, TypeError):  # Invalid JSON
+            continue
+        
+        if isinstance(json_data, list):
+            entities = json_data
+        elif isinstance(json_data, dict):
+            entities = [json_data]
+            if isinstance(json_data.get('@graph'), list):
+                entities.extend(json_data['@graph'])
+        else:
+            continue
+        
+        for entity in entities:
+            if isinstance(entity, dict) and entity.get('@type') == 'LocalBusiness':
+                return entity
+    return None
+
+
+# Default value for every profile field (key order = CSV column order)
+# Read-only; _extract_data_from_soup starts from a .copy() (a plain dict copy - dict(proxy) is much slower)
+_DATA_TEMPLATE = MappingProxyType({
+    'attorney_full_name': None,
+    'profile_url': None,
+    'firm_name': None,
+    'company_address': None,
+    'company_city': None,
+    'company_state': None,
+    'company_zip': None,
+    'company_country': 'United States',
+    'company_phone_number': None,
+    'company_fax_number': None,
+    'company_website': None,  # Actual business website URL
+    'overall_average_rating': None,
+    'total_review_count': 0,
+    'avvo_reviews_count': 0,
+    'lawyers_com_reviews_count': 0,
+    'avvo_rating': None,
+    'avvo_rating_description': None,
+    'years_licensed': None,
+    'year_licensed': None,
+    'years_licensed_text': None,  # Full text: "Licensed for 35 years"
+    'practice_areas': None,
+    'primary_practice_area': None,
+    'lawyer_at_location': None,  # e.g., "Immigration Lawyer at San Mateo, CA"
+    'languages_spoken': None,
+    'is_pro': False,
+    'is_claimed': False,
+    'free_consultation': False,
+    'virtual_consultation_available': False,  # Virtual Consultation Available
+    'contingency_fee': None,
+    'hourly_rate': None,
+    'retainer_info': None,  # Retainer information
+    'cost_details': None,  # Cost section details
+    'payment_methods': None,  # Payment methods (Check, Credit Card, etc.)
+    'currencies_accepted': None,  # USD, etc.
+    'education': None,
+    'bar_admissions': None,
+    'license_details': None,  # Detailed license information
+    'send_message_link': None,  # Link to send message
+    'google_map_directions_link': None,  # Google Maps directions link
+    'profile_photo_url': None,  # Profile photo/image URL
+    'latitude': None,  # Geo coordinates latitude
+    'longitude': None,  # Geo coordinates longitude
+    'practice_area_percentages': None,  # Practice area percentages from pie chart (JSON)
+    'honors_awards': None,
+    'associations': None,
+    'work_experience': None,
+    'endorsements_received': 0,
+    'endorsements_given': 0,
+    'legal_answers': 0,
+    'biography': None,
+    'professional_id': None,
+    'specialty_id': None,
+    'specialty_name': None,
+    'claim_status': None,
+    'additional_practice_areas': None,
+    'total_reviews_extracted': 0,
+    'scraped_at': None,  # Set per profile in _extract_data_from_soup
+    'review_date_filter': None,  # Review date filter information (e.g., "Last 365 days (from 2024-12-27)" or "All reviews (no date filter)")
+    # Nomenclature breakdown fields (Avvo format)
+    'nomenclature_source': 'avvo',  # Source: avvo
+    'nomenclature_id': None,  # Full ID: 94401-ca-haitham-ballout-336338
+    'nomenclature_zip_code': None,  # 94401
+    'nomenclature_state_code': None,  # ca
+    'nomenclature_name': None,  # haitham-ballout
+    'nomenclature_profile_id': None  # 336338
+})
+
+# Default value for every review field (key order = review CSV columns, after the profile columns)
+# Read-only; each review starts from a .copy() - a plain dict copy, much cheaper than a dict literal
+_REVIEW_TEMPLATE = MappingProxyType({
+    'reviewer_name': None,
+    'review_date': None,
+    'review_rating': 0,
+    'review_title': None,
+    'review_text': None,
+    'review_type': None,  # e.g., "Consulted Attorney"
+    'review_tooltip': None,  # Tooltip explanation if available
+    # Attorney response fields
+    'attorney_response_name': None,  # Attorney name who replied
+    'attorney_response_date': None,  # Date attorney replied
+    'attorney_response_text': None  # Attorney's reply text
+})
+_REVIEW_CSV_FIELDS = tuple(_REVIEW_TEMPLATE)
+
+
 def _extract_data_from_soup(soup, review_date_filter=None):
     """
     Internal function to extract data from BeautifulSoup object
@@ -77,89 +578,94 @@ def _extract_data_from_soup(soup, review_date_filter=None):
         review_date_filter: Optional string describing the review date filter applied
     """
     
-    # Initialize data structure
-    data = {
-        'attorney_full_name': None,
-        'profile_url': None,
-        'firm_name': None,
-        'company_address': None,
-        'company_city': None,
-        'company_state': None,
-        'company_zip': None,
-        'company_country': 'United States',
-        'company_phone_number': None,
-        'company_fax_number': None,
-        'company_website': None,  # Actual business website URL
-        'overall_average_rating': None,
-        'total_review_count': 0,
-        'avvo_reviews_count': 0,
-        'lawyers_com_reviews_count': 0,
-        'avvo_rating': None,
-        'avvo_rating_description': None,
-        'years_licensed': None,
-        'year_licensed': None,
-        'years_licensed_text': None,  # Full text: "Licensed for 35 years"
-        'practice_areas': None,
-        'primary_practice_area': None,
-        'lawyer_at_location': None,  # e.g., "Immigration Lawyer at San Mateo, CA"
-        'languages_spoken': None,
-        'is_pro': False,
-        'is_claimed': False,
-        'free_consultation': False,
-        'virtual_consultation_available': False,  # Virtual Consultation Available
-        'contingency_fee': None,
-        'hourly_rate': None,
-        'retainer_info': None,  # Retainer information
-        'cost_details': None,  # Cost section details
-        'payment_methods': None,  # Payment methods (Check, Credit Card, etc.)
-        'currencies_accepted': None,  # USD, etc.
-        'education': None,
-        'bar_admissions': None,
-        'license_details': None,  # Detailed license information
-        'send_message_link': None,  # Link to send message
-        'google_map_directions_link': None,  # Google Maps directions link
-        'profile_photo_url': None,  # Profile photo/image URL
-        'latitude': None,  # Geo coordinates latitude
-        'longitude': None,  # Geo coordinates longitude
-        'practice_area_percentages': None,  # Practice area percentages from pie chart (JSON)
-        'honors_awards': None,
-        'associations': None,
-        'work_experience': None,
-        'endorsements_received': 0,
-        'endorsements_given': 0,
-        'legal_answers': 0,
-        'biography': None,
-        'professional_id': None,
-        'specialty_id': None,
-        'specialty_name': None,
-        'claim_status': None,
-        'additional_practice_areas': None,
-        'total_reviews_extracted': 0,
-        'scraped_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'review_date_filter': None,  # Review date filter information (e.g., "Last 365 days (from 2024-12-27)" or "All reviews (no date filter)")
-        # Nomenclature breakdown fields (Avvo format)
-        'nomenclature_source': 'avvo',  # Source: avvo
-        'nomenclature_id': None,  # Full ID: 94401-ca-haitham-ballout-336338
-        'nomenclature_zip_code': None,  # 94401
-        'nomenclature_state_code': None,  # ca
-        'nomenclature_name': None,  # haitham-ballout
-        'nomenclature_profile_id': None  # 336338
-    }
+    # Initialize data structure from the shared template
+    data = _DATA_TEMPLATE.copy()
+    data['scraped_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    # Index tags by class/id once instead of walking the tree for every soup.find
+    class_index, id_index, tag_index = _build_index(soup)
+    
+    # Page text computed once - cheap substring tests decide whether the
+    # find(string=...) scans below (one full tree walk each) are needed at all
+    page_text = soup.get_text(' ')
+    page_text_lower = page_text.lower()
+    
+    # Read the embedded JSON first - it is much cheaper than walking the HTML,
+    # and the HTML probes below only fill the fields it left empty
+    # Extract JSON payload data (contains structured data)
+    # (parsed once - the practice area fallback below reuses payload_json)
+    payload_json = None
+    payload_div = _find_by_id(id_index, 'div', 'payload')
+    if payload_div and payload_div.get('data-payload'):
+        try:
+            payload_json = _loads(payload_div['data-payload'])
+            data['professional_id'] = payload_json.get('professionalId')
+            data['specialty_id'] = payload_json.get('specialty_id')
+            data['specialty_name'] = payload_json.get('specialtyName')
+            data['claim_status'] = payload_json.get('claimStatus')
+            
+            # Ratings from JSON are more accurate than the HTML ones
+            if 'reviewScore' in payload_json:
+                data['overall_average_rating'] = payload_json.get('reviewScore')
+            if 'reviews' in payload_json:
+                data['total_review_count'] = payload_json.get('reviews', 0)
+            if 'rating' in payload_json:
+                data['avvo_rating'] = payload_json.get('rating')
+        except:
+            pass
+    
+    # Extract JSON-LD structured data (contains profile photo, geo, payment methods, etc.)
+    # (only the first LocalBusiness entry is needed)
+    json_data = _find_local_business(tag_index['ld_json'])
+    if json_data:
+        # Extract profile photo URL
+        if 'image' in json_data:
+            data['profile_photo_url'] = json_data['image']
+        
+        # Extract geo coordinates
+        geo = json_data.get('geo')
+        if isinstance(geo, dict) and geo.get('@type') == 'GeoCoordinates':
+            data['latitude'] = geo.get('latitude')
+            data['longitude'] = geo.get('longitude')
+        
+        # Extract payment methods
+        if 'paymentAccepted' in json_data:
+            data['payment_methods'] = json_data['paymentAccepted']
+        
+        # Extract currencies accepted
+        if 'currenciesAccepted' in json_data:
+            data['currencies_accepted'] = json_data['currenciesAccepted']
+        
+        # Extract review count from aggregateRating
+        rating_data = json_data.get('aggregateRating')
+        if isinstance(rating_data, dict):
+            if 'reviewCount' in rating_data:
+                data['total_review_count'] = rating_data['reviewCount']
+            if 'ratingValue' in rating_data:
+                data['overall_average_rating'] = rating_data['ratingValue']
+        
+        # Extract makesOffer (retainer info)
+        if 'makesOffer' in json_data:
+            data['retainer_info'] = json_data['makesOffer']
+        
+        # Extract actual business website URL from sameAs
+        if 'sameAs' in json_data:
+            data['company_website'] = json_data['sameAs']
     
     # Extract attorney name
-    name_elem = soup.find('h1', class_='profile-name')
+    name_elem = _find_indexed(class_index, 'h1', 'profile-name')
     if name_elem:
-        data['attorney_full_name'] = name_elem.get_text(strip=True)
+        data['attorney_full_name'] = _text(name_elem)
     
     # Extract profile URL from canonical link or current URL
-    canonical = soup.find('link', rel='canonical')
+    canonical = tag_index['canonical'][0] if tag_index['canonical'] else None
     if canonical:
         data['profile_url'] = canonical.get('href')
     
     # Parse nomenclature from profile URL
     # Format: /attorneys/94401-ca-haitham-ballout-336338.html
     if data['profile_url']:
-        match = re.search(r'/attorneys/([^/]+)\.html', data['profile_url'])
+        match = _RE_NOMEN.search(data['profile_url'])
         if match:
             nomenclature_id = match.group(1)
             data['nomenclature_id'] = nomenclature_id
@@ -189,14 +695,14 @@ def _extract_data_from_soup(soup, review_date_filter=None):
                     data['nomenclature_name'] = name
     
     # Extract firm name
-    firm_elem = soup.find('div', class_='location-detail')
+    firm_elem = _find_indexed(class_index, 'div', 'location-detail')
     if firm_elem:
         firm_h4 = firm_elem.find('h4')
         if firm_h4:
-            data['firm_name'] = firm_h4.get_text(strip=True)
+            data['firm_name'] = _text(firm_h4)
     
     # Extract address
-    location_elem = soup.find('p', id='masthead-location')
+    location_elem = _find_by_id(id_index, 'p', 'masthead-location')
     if location_elem:
         address_text = location_elem.get_text(strip=True)
         data['company_address'] = address_text
@@ -205,18 +711,19 @@ def _extract_data_from_soup(soup, review_date_filter=None):
         parts = [p.strip() for p in address_text.split(',')]
         if len(parts) >= 2:
             last_part = parts[-1].strip()
-            state_zip = re.match(r'([A-Z]{2})\s*,?\s*(\d{5}(?:-\d{4})?)?', last_part)
-            if state_zip:
-                data['company_state'] = state_zip.group(1)
-                if state_zip.group(2):
-                    data['company_zip'] = state_zip.group(2)
+            state, zip_code = _parse_state_zip(last_part)
+            if state:
+                data['company_state'] = state
+                if zip_code:
+                    data['company_zip'] = zip_code
             if len(parts) >= 2:
                 data['company_city'] = parts[-2].strip()
     
     # Extract phone number
-    phone_elem = soup.find('span', class_='overridable-lawyer-phone-copy')
+    phone_elem = _find_indexed(class_index, 'span', 'overridable-lawyer-phone-copy')
     if not phone_elem:
-        phone_elem = soup.find('a', href=re.compile(r'^tel:'))
+        tel_links = tag_index['tel']
+        phone_elem = tel_links[0] if tel_links else None
     if phone_elem:
         if hasattr(phone_elem, 'get_text'):
             data['company_phone_number'] = phone_elem.get_text(strip=True)
@@ -224,7 +731,7 @@ def _extract_data_from_soup(soup, review_date_filter=None):
             data['company_phone_number'] = phone_elem.get('href', '').replace('tel:', '').strip()
     
     # Extract fax number
-    fax_elem = soup.find('span', class_='fax')
+    fax_elem = _find_indexed(class_index, 'span', 'fax')
     if fax_elem:
         fax_parent = fax_elem.find_parent('a')
         if fax_parent:
@@ -233,7 +740,7 @@ def _extract_data_from_soup(soup, review_date_filter=None):
     # Extract actual business website URL (not the Avvo redirect)
     # First try from href attribute (before onclick modifies it)
     if not data.get('company_website'):
-        website_link = soup.find('a', class_='cta-website')
+        website_link = _find_indexed(class_index, 'a', 'cta-website')
         if website_link:
             href = website_link.get('href', '')
             if href and not href.startswith('#') and not href.startswith('https://www.avvo.com'):
@@ -241,60 +748,63 @@ def _extract_data_from_soup(soup, review_date_filter=None):
         
         # Also try from location section website link
         if not data.get('company_website'):
-            location_website_link = soup.find('a', class_='contact-website')
+            location_website_link = _find_indexed(class_index, 'a', 'contact-website')
             if location_website_link:
                 href = location_website_link.get('href', '')
                 if href and not href.startswith('#') and not href.startswith('https://www.avvo.com'):
                     data['company_website'] = href
     
-    # Extract review score
-    review_score_elem = soup.find('span', class_='aggregated-ratings-count')
-    if review_score_elem:
-        try:
-            data['overall_average_rating'] = float(review_score_elem.get_text(strip=True))
-        except:
-            pass
+    # Extract review score (if not in JSON)
+    if data['overall_average_rating'] is None:
+        review_score_elem = _find_indexed(class_index, 'span', 'aggregated-ratings-count')
+        if review_score_elem:
+            try:
+                data['overall_average_rating'] = float(_text(review_score_elem))
+            except:
+                pass
     
-    # Extract total review count
-    review_count_elem = soup.find('p', class_='aggregated-ratings-description')
-    if review_count_elem:
-        count_text = review_count_elem.get_text(strip=True)
-        match = re.search(r'(\d+)\s+Client Reviews', count_text)
-        if match:
-            data['total_review_count'] = int(match.group(1))
+    # Extract total review count (if not in JSON)
+    if not data['total_review_count']:
+        review_count_elem = _find_indexed(class_index, 'p', 'aggregated-ratings-description')
+        if review_count_elem:
+            count_text = _text(review_count_elem)
+            match = _RE_CLIENT_REVIEWS.search(count_text)
+            if match:
+                data['total_review_count'] = int(match.group(1))
     
     # Extract Avvo vs Lawyers.com review counts
-    avvo_count = soup.find('p', class_='aggregrated-reviews-total')
+    avvo_count = _find_indexed(class_index, 'p', 'aggregrated-reviews-total')
     if avvo_count:
-        match = re.search(r'\((\d+)\)', avvo_count.get_text())
+        match = _RE_PAREN_NUM.search(avvo_count.get_text())
         if match:
             data['avvo_reviews_count'] = int(match.group(1))
     
-    ldc_count = soup.find('p', class_='aggregrated-reviews-total total-ldc')
+    ldc_count = _find_indexed(class_index, 'p', 'aggregrated-reviews-total total-ldc')
     if ldc_count:
-        match = re.search(r'\((\d+)\)', ldc_count.get_text())
+        match = _RE_PAREN_NUM.search(ldc_count.get_text())
         if match:
             data['lawyers_com_reviews_count'] = int(match.group(1))
     
-    # Extract Avvo rating
-    avvo_rating_text = soup.find('span', class_='avvo-rating-count')
-    if avvo_rating_text:
-        rating_text = avvo_rating_text.get_text(strip=True)
-        match = re.search(r'Rating:\s*([\d.]+)', rating_text)
-        if match:
-            data['avvo_rating'] = float(match.group(1))
+    # Extract Avvo rating (if not in JSON)
+    if data['avvo_rating'] is None:
+        avvo_rating_text = _find_indexed(class_index, 'span', 'avvo-rating-count')
+        if avvo_rating_text:
+            rating_text = _text(avvo_rating_text)
+            match = _RE_RATING.search(rating_text)
+            if match:
+                data['avvo_rating'] = float(match.group(1))
     
     # Extract rating description
-    rating_desc = soup.find('span', class_='attorney-rating-level')
+    rating_desc = _find_indexed(class_index, 'span', 'attorney-rating-level')
     if rating_desc:
-        data['avvo_rating_description'] = rating_desc.get_text(strip=True)
+        data['avvo_rating_description'] = _text(rating_desc)
     
     # Extract years licensed
-    years_elem = soup.find('p', string=re.compile(r'Licensed for \d+ years'))
+    years_elem = soup.find('p', string=_RE_LICENSED) if 'Licensed for ' in page_text else None
     if years_elem:
-        years_text = years_elem.get_text(strip=True)
+        years_text = _text(years_elem)
         data['years_licensed_text'] = years_text  # Full text: "Licensed for 35 years"
-        match = re.search(r'Licensed for (\d+) years', years_text)
+        match = _RE_LICENSED.search(years_text)
         if match:
             data['years_licensed'] = int(match.group(1))
             current_year = datetime.now().year
@@ -302,69 +812,77 @@ def _extract_data_from_soup(soup, review_date_filter=None):
     
     # Extract practice areas - multiple methods with comprehensive fallbacks
     practice_areas = []
+    seen_pas = set()  # casefolded names already in practice_areas
+    
+    # Candidate tags for Methods 1-6, taken from the class/link indexes
+    # (each list keeps document order, so the methods below behave as before)
+    practice_area_list = _find_indexed(class_index, 'span', 'practice-area-list')
+    pa_elems = [tag for tag in class_index.get('profile-practice-area', ()) if tag.name == 'span']
+    pa_links = [tag for tag in class_index.get('practice-area-title', ()) if tag.name == 'a']
+    pa_titles = [tag for tag in class_index.get('practice-area-title', ()) if tag.name == 'strong']
+    pa_detail_divs = [tag for tag in class_index.get('practice-area-detail', ()) if tag.name == 'div']
+    pa_title_links = tag_index['practice_area']
     
     # Method 1: Try to get from practice-area-list span (most complete)
-    practice_area_list = soup.find('span', class_='practice-area-list')
     if practice_area_list:
         pa_text = practice_area_list.get_text(strip=True)
         # Split by comma and clean
         pa_list = [pa.strip() for pa in pa_text.split(',') if pa.strip()]
         practice_areas.extend(pa_list)
+        seen_pas.update(pa.casefold() for pa in pa_list)
     
     # Method 2: From profile header
     if not practice_areas:
-        pa_elems = soup.find_all('span', class_='profile-practice-area')
         for elem in pa_elems:
             pa_name = elem.get_text(strip=True)
-            if pa_name and pa_name not in practice_areas:
+            if pa_name and pa_name.casefold() not in seen_pas:
                 practice_areas.append(pa_name)
+                seen_pas.add(pa_name.casefold())
     
     # Method 3: From practice area section (practice-area-title links) - ALWAYS run
-    pa_links = soup.find_all('a', class_='practice-area-title')
     for link in pa_links:
         # Get text from strong tags inside the link (more reliable)
-        strong_tags = link.find_all('strong')
-        if strong_tags:
-            # First strong tag is usually the practice area name
-            pa_name = strong_tags[0].get_text(strip=True)
+        # First strong tag is usually the practice area name
+        strong = link.find('strong')
+        if strong:
+            pa_name = _text(strong)
             # Skip if it's a percentage (contains %)
-            if pa_name and '%' not in pa_name and pa_name not in practice_areas:
+            if pa_name and '%' not in pa_name and pa_name.casefold() not in seen_pas:
                 practice_areas.append(pa_name)
+                seen_pas.add(pa_name.casefold())
         else:
             # Fallback to link text
             pa_name = link.get_text(strip=True)
-            if pa_name and pa_name not in practice_areas:
+            if pa_name and pa_name.casefold() not in seen_pas:
                 practice_areas.append(pa_name)
+                seen_pas.add(pa_name.casefold())
     
     # Method 4: From practice-area-title strong tags directly
-    pa_titles = soup.find_all('strong', class_='practice-area-title')
     for title in pa_titles:
-        pa_name = title.get_text(strip=True)
+        pa_name = _text(title)
         # Skip if it's a percentage or number
-        if pa_name and '%' not in pa_name and not pa_name.isdigit() and pa_name not in practice_areas:
+        if pa_name and '%' not in pa_name and not pa_name.isdigit() and pa_name.casefold() not in seen_pas:
             practice_areas.append(pa_name)
+            seen_pas.add(pa_name.casefold())
     
     # Method 5: From practice-area-detail divs (pie chart section) - ALWAYS run to get all practice areas
-    pa_detail_divs = soup.find_all('div', class_='practice-area-detail')
     for pa_div in pa_detail_divs:
-        # Look for practice area name in practice-area-title
-        pa_title = pa_div.find('div', class_='practice-area-title')
-        if not pa_title:
-            # Also check for practice-area-title as a link
-            pa_title = pa_div.find('a', class_='practice-area-title')
+        # Look for practice area name in practice-area-title (<div>, or a link as fallback)
+        pa_title = _practice_area_title(pa_div)
         
         if pa_title:
-            strong_tags = pa_title.find_all('strong')
-            if strong_tags:
-                # First strong tag is the practice area name
-                pa_name = strong_tags[0].get_text(strip=True)
+            # First strong tag is the practice area name
+            strong = pa_title.find('strong')
+            if strong:
+                pa_name = _text(strong)
                 # Skip percentages and numbers
-                if pa_name and '%' not in pa_name and not pa_name.isdigit() and pa_name not in practice_areas:
+                if pa_name and '%' not in pa_name and not pa_name.isdigit() and pa_name.casefold() not in seen_pas:
                     practice_areas.append(pa_name)
+                    seen_pas.add(pa_name.casefold())
                 
                 # Also check for additional practice areas in expanded elements
                 # Look for expandedElement or similar divs that contain additional practice areas
-                expanded_div = pa_div.find('div', class_=re.compile(r'expanded|expand', re.IGNORECASE))
+                expanded_div = pa_div.find('div', class_=_RE_EXPAND)
                 if expanded_div:
                     # Look for paragraphs that might contain additional practice areas
                     for p in expanded_div.find_all('p'):
@@ -378,60 +896,63 @@ def _extract_data_from_soup(soup, review_date_filter=None):
                                 add_pa_clean = add_pa.strip()
                                 # Skip if it's too short or contains common non-practice-area words
                                 if (add_pa_clean and len(add_pa_clean) > 2 and 
-                                    add_pa_clean not in practice_areas and
+                                    add_pa_clean.casefold() not in seen_pas and
                                     not any(word in add_pa_clean.lower() for word in ['years', 'cases', 'case', 'read more', 'see more'])):
                                     practice_areas.append(add_pa_clean)
+                                    seen_pas.add(add_pa_clean.casefold())
     
     # Method 6: From practice-area-title links (alternative structure)
     if not practice_areas:
-        pa_title_links = soup.find_all('a', href=re.compile(r'/.*-lawyer/'))
         for link in pa_title_links:
             strong = link.find('strong')
             if strong:
-                pa_name = strong.get_text(strip=True)
-                if pa_name and '%' not in pa_name and not pa_name.isdigit() and pa_name not in practice_areas:
+                pa_name = _text(strong)
+                if pa_name and '%' not in pa_name and not pa_name.isdigit() and pa_name.casefold() not in seen_pas:
                     practice_areas.append(pa_name)
+                    seen_pas.add(pa_name.casefold())
     
     # Method 7: From "Practice Areas:" text pattern
-    if not practice_areas:
-        practice_areas_section = soup.find('h3', string=re.compile(r'Practice Areas', re.IGNORECASE))
+    if not practice_areas and 'practice areas' in page_text_lower:
+        practice_areas_section = soup.find('h3', string=_RE_PRACTICE_AREAS)
         if practice_areas_section:
             # Look for practice area links or text in the following siblings
             parent = practice_areas_section.find_parent()
             if parent:
                 # Find all links that might be practice areas
-                pa_links = parent.find_all('a', href=re.compile(r'lawyer'))
+                pa_links = parent.find_all('a', href=_RE_LAWYER)
                 for link in pa_links:
                     pa_name = link.get_text(strip=True)
-                    if pa_name and len(pa_name) > 2 and pa_name not in practice_areas:
+                    if pa_name and len(pa_name) > 2 and pa_name.casefold() not in seen_pas:
                         # Filter out common non-practice-area text
                         if not any(word in pa_name.lower() for word in ['more', 'see', 'view', 'all', 'page']):
                             practice_areas.append(pa_name)
+                            seen_pas.add(pa_name.casefold())
     
     # Method 8: Extract from JSON payload if available
-    if not practice_areas:
-        payload_div = soup.find('div', {'id': 'payload'})
-        if payload_div and payload_div.get('data-payload'):
-            try:
-                payload_json = json.loads(payload_div['data-payload'])
-                # Check for practice areas in various JSON fields
-                if 'specialtyName' in payload_json:
-                    specialty = payload_json.get('specialtyName')
-                    if specialty and specialty not in practice_areas:
-                        practice_areas.append(specialty)
-            except:
-                pass
+    if not practice_areas and payload_json is not None:
+        try:
+            # Check for practice areas in various JSON fields
+            if 'specialtyName' in payload_json:
+                specialty = payload_json.get('specialtyName')
+                if specialty and specialty.casefold() not in seen_pas:
+                    practice_areas.append(specialty)
+                    seen_pas.add(specialty.casefold())
+        except:
+            pass
     
     # Clean and deduplicate practice areas
     cleaned_practice_areas = []
+    seen_clean = set()
     for pa in practice_areas:
         pa_clean = pa.strip()
         # Skip if empty, is a number, contains %, or is too short
         if pa_clean and not pa_clean.isdigit() and '%' not in pa_clean and len(pa_clean) > 2:
             # Remove common suffixes/prefixes
-            pa_clean = re.sub(r'^\d+\s*%?\s*', '', pa_clean)  # Remove leading numbers/percentages
-            pa_clean = re.sub(r'\s*%$', '', pa_clean)  # Remove trailing %
-            if pa_clean and pa_clean not in cleaned_practice_areas:
+            pa_clean = _RE_LEADING_PCT.sub('', pa_clean)  # Remove leading numbers/percentages
+            pa_clean = _RE_TRAILING_PCT.sub('', pa_clean)  # Remove trailing %
+            pa_key = pa_clean.casefold()
+            if pa_clean and pa_key not in seen_clean:
+                seen_clean.add(pa_key)
                 cleaned_practice_areas.append(pa_clean)
     
     if cleaned_practice_areas:
@@ -441,27 +962,27 @@ def _extract_data_from_soup(soup, review_date_filter=None):
     # Extract "Lawyer at [Location]" from profile header
     # Format: "[Practice Area] Lawyer at [City, State]"
     # Find the grid-with-icon div that contains icon-practice-area
-    practice_area_icons = soup.find_all('i', class_='icon-practice-area')
-    for icon in practice_area_icons:
-        grid_div = icon.find_parent('div', class_='grid-with-icon')
-        if grid_div:
-            # Find practice area span
-            pa_span = grid_div.find('span', class_='profile-practice-area')
-            # Find location span
-            location_span = grid_div.find('span', class_='profile-location')
-            
-            if pa_span and location_span:
-                pa_name = pa_span.get_text(strip=True)
-                location_text = location_span.get_text(strip=True)
-                # Combine: "Immigration Lawyer at San Mateo, CA"
-                if location_text.startswith('at '):
-                    location_text = location_text[3:]  # Remove "at " prefix
-                data['lawyer_at_location'] = f"{pa_name} Lawyer at {location_text}"
-                break
+    # (look down from the indexed grid divs instead of walking up from each icon)
+    for grid_div in class_index.get('grid-with-icon', ()):
+        if grid_div.name != 'div' or not grid_div.find('i', class_='icon-practice-area'):
+            continue
+        # Find practice area span
+        pa_span = grid_div.find('span', class_='profile-practice-area')
+        # Find location span
+        location_span = grid_div.find('span', class_='profile-location')
+        
+        if pa_span and location_span:
+            pa_name = _text(pa_span)
+            location_text = _text(location_span)
+            # Combine: "Immigration Lawyer at San Mateo, CA"
+            if location_text.startswith('at '):
+                location_text = location_text[3:]  # Remove "at " prefix
+            data['lawyer_at_location'] = f"{pa_name} Lawyer at {location_text}"
+            break
     
     # Extract languages
     languages = []
-    lang_section = soup.find('div', class_='languages-list')
+    lang_section = _find_indexed(class_index, 'div', 'languages-list')
     if lang_section:
         lang_elems = lang_section.find_all('p')
         for elem in lang_elems:
@@ -473,91 +994,93 @@ def _extract_data_from_soup(soup, review_date_filter=None):
         data['languages_spoken'] = ', '.join(languages)
     
     # Extract PRO status
-    pro_elem = soup.find('div', class_='pro')
+    pro_elem = _find_indexed(class_index, 'div', 'pro')
     if pro_elem:
         data['is_pro'] = True
     
     # Extract free consultation
-    consult_elem = soup.find('p', string=re.compile(r'Free Consultation'))
+    consult_elem = soup.find('p', string=_RE_FREE_CONSULT) if 'Free Consultation' in page_text else None
     if consult_elem:
         data['free_consultation'] = True
     
     # Extract virtual consultation availability
     # Look for "Virtual Consultation Available" text in the masthead area
-    virtual_consult_elem = soup.find('p', string=re.compile(r'Virtual Consultation Available', re.IGNORECASE))
+    virtual_consult_elem = None
+    if 'virtual consultation available' in page_text_lower:
+        virtual_consult_elem = soup.find('p', string=_RE_VIRTUAL_CONSULT)
     if virtual_consult_elem:
         data['virtual_consultation_available'] = True
     else:
         # Also check for icon-video which indicates virtual consultation
-        video_icon = soup.find('i', class_='icon-video')
-        if video_icon:
+        # (rows holding the icon, looked up from the index instead of walking up from the icon)
+        for row_div in class_index.get('flex-row-with-border-radius', ()):
+            if row_div.name != 'div' or not row_div.find('i', class_='icon-video'):
+                continue
             # Check if there's a "Virtual Consultation" text nearby
-            parent_div = video_icon.find_parent('div', class_='flex-row-with-border-radius')
-            if parent_div:
-                virtual_text = parent_div.find('p', string=re.compile(r'Virtual', re.IGNORECASE))
-                if virtual_text:
-                    data['virtual_consultation_available'] = True
+            if row_div.find('p', string=_RE_VIRTUAL):
+                data['virtual_consultation_available'] = True
+                break
     
     # Extract fees
-    fee_section = soup.find('section', class_='fees-section')
+    fee_section = _find_indexed(class_index, 'section', 'fees-section')
     if fee_section:
         # Look for contingency fee
-        contingency = fee_section.find(string=re.compile(r'Contingency'))
+        contingency = fee_section.find(string=_RE_CONTINGENCY)
         if contingency:
-            match = re.search(r'(\d+)%', contingency)
+            match = _RE_PCT_NUM.search(contingency)
             if match:
                 data['contingency_fee'] = f"{match.group(1)}%"
         
         # Look for hourly rate
-        hourly = fee_section.find(string=re.compile(r'\$\d+'))
+        hourly = fee_section.find(string=_RE_DOLLAR_NUM)
         if hourly:
-            match = re.search(r'\$(\d+)', hourly)
+            match = _RE_DOLLAR_NUM.search(hourly)
             if match:
                 data['hourly_rate'] = f"${match.group(1)}"
     
     # Extract endorsements
-    endorsement_received = soup.find('label', class_='endorsement-received-button')
+    endorsement_received = _find_indexed(class_index, 'label', 'endorsement-received-button')
     if endorsement_received:
         count_span = endorsement_received.find('span')
         if count_span:
             try:
-                data['endorsements_received'] = int(count_span.get_text(strip=True))
+                data['endorsements_received'] = int(_text(count_span))
             except:
                 pass
     
-    endorsement_given = soup.find('label', class_='endorsement-given-button')
+    endorsement_given = _find_indexed(class_index, 'label', 'endorsement-given-button')
     if endorsement_given:
         count_span = endorsement_given.find('span')
         if count_span:
             try:
-                data['endorsements_given'] = int(count_span.get_text(strip=True))
+                data['endorsements_given'] = int(_text(count_span))
             except:
                 pass
     
     # Extract legal answers count
-    legal_answers_section = soup.find('section', class_='legal-answers-count')
+    legal_answers_section = _find_indexed(class_index, 'section', 'legal-answers-count')
     if legal_answers_section:
         count_elem = legal_answers_section.find('strong')
         if count_elem:
             try:
-                data['legal_answers'] = int(count_elem.get_text(strip=True))
+                data['legal_answers'] = int(_text(count_elem))
             except:
                 pass
     
     # Extract education
     education_list = []
-    education_section = soup.find('section', class_='education-container')
+    education_section = _find_indexed(class_index, 'section', 'education-container')
     if education_section:
-        exp_items = education_section.find_all('div', class_='experience')
+        exp_items = _find_all_by_class(education_section, 'div', 'experience')
         for item in exp_items:
             year_elem = item.find('p')
             school_elem = item.find('strong')
             degree_elems = item.find_all('p')
             
             if school_elem:
-                year = year_elem.get_text(strip=True) if year_elem else ''
-                school = school_elem.get_text(strip=True)
-                degree = degree_elems[1].get_text(strip=True) if len(degree_elems) > 1 else ''
+                year = _text(year_elem) if year_elem else ''
+                school = _text(school_elem)
+                degree = _text(degree_elems[1]) if len(degree_elems) > 1 else ''
                 education_list.append(f"{school} ({degree}) - {year}")
     
     if education_list:
@@ -565,22 +1088,23 @@ def _extract_data_from_soup(soup, review_date_filter=None):
     
     # Extract bar admissions
     licenses = []
-    license_section = soup.find('section', class_='license-container')
+    license_items = []  # Reused for the detailed license information below
+    license_section = _find_indexed(class_index, 'section', 'license-container')
     if license_section:
-        license_items = license_section.find_all('div', class_='license')
+        license_items = _find_all_by_class(license_section, 'div', 'license')
         for item in license_items:
             title = item.find('h4', class_='license-title')
             if title:
-                licenses.append(title.get_text(strip=True))
+                licenses.append(_text(title))
     
     if licenses:
         data['bar_admissions'] = ' | '.join(licenses)
     
     # Extract honors/awards
     honors = []
-    honors_section = soup.find('section', class_='honors-container')
+    honors_section = _find_indexed(class_index, 'section', 'honors-container')
     if honors_section:
-        honor_items = honors_section.find_all('div', class_='experience')
+        honor_items = _find_all_by_class(honors_section, 'div', 'experience')
         for item in honor_items:
             honor_text = item.get_text(strip=True)
             if honor_text:
@@ -591,22 +1115,22 @@ def _extract_data_from_soup(soup, review_date_filter=None):
     
     # Extract associations
     associations = []
-    assoc_section = soup.find('section', class_='associations-container')
+    assoc_section = _find_indexed(class_index, 'section', 'associations-container')
     if assoc_section:
-        assoc_items = assoc_section.find_all('div', class_='experience')
+        assoc_items = _find_all_by_class(assoc_section, 'div', 'experience')
         for item in assoc_items:
             assoc_name = item.find('strong')
             if assoc_name:
-                associations.append(assoc_name.get_text(strip=True))
+                associations.append(_text(assoc_name))
     
     if associations:
         data['associations'] = ' | '.join(associations)
     
     # Extract work experience
     work_exp = []
-    work_section = soup.find('section', class_='work-experience-container')
+    work_section = _find_indexed(class_index, 'section', 'work-experience-container')
     if work_section:
-        work_items = work_section.find_all('div', class_='experience')
+        work_items = _find_all_by_class(work_section, 'div', 'experience')
         for item in work_items:
             work_text = item.get_text(strip=True)
             if work_text:
@@ -616,101 +1140,36 @@ def _extract_data_from_soup(soup, review_date_filter=None):
         data['work_experience'] = ' | '.join(work_exp)
     
     # Extract biography/About section
-    about_section = soup.find('section', class_='about-container')
+    about_section = _find_indexed(class_index, 'section', 'about-container')
     if about_section:
         about_text = about_section.get_text(strip=True)
         # Clean up the text
-        about_text = re.sub(r'\s+', ' ', about_text)
+        about_text = ' '.join(about_text.split())
         data['biography'] = about_text
     
-    # Extract JSON payload data (contains structured data)
-    payload_div = soup.find('div', {'id': 'payload'})
-    if payload_div and payload_div.get('data-payload'):
-        try:
-            payload_json = json.loads(payload_div['data-payload'])
-            data['professional_id'] = payload_json.get('professionalId')
-            data['specialty_id'] = payload_json.get('specialty_id')
-            data['specialty_name'] = payload_json.get('specialtyName')
-            data['claim_status'] = payload_json.get('claimStatus')
-            
-            # Override ratings from JSON if available (more accurate)
-            if 'reviewScore' in payload_json:
-                data['overall_average_rating'] = payload_json.get('reviewScore')
-            if 'reviews' in payload_json:
-                data['total_review_count'] = payload_json.get('reviews', 0)
-            if 'rating' in payload_json:
-                data['avvo_rating'] = payload_json.get('rating')
-        except:
-            pass
-    
     # Extract additional practice areas links
-    additional_pa_section = soup.find('aside', class_='additional-practice-areas-container')
+    additional_pa_section = _find_indexed(class_index, 'aside', 'additional-practice-areas-container')
     if additional_pa_section:
         pa_links = additional_pa_section.find_all('a')
         additional_pas = [link.get_text(strip=True) for link in pa_links if link.get_text(strip=True)]
         if additional_pas:
             data['additional_practice_areas'] = ' | '.join(additional_pas)
     
-    # Extract JSON-LD structured data (contains profile photo, geo, payment methods, etc.)
-    json_ld_scripts = soup.find_all('script', type='application/ld+json')
-    for script in json_ld_scripts:
-        try:
-            json_data = json.loads(script.string)
-            if json_data.get('@type') == 'LocalBusiness':
-                # Extract profile photo URL
-                if 'image' in json_data:
-                    data['profile_photo_url'] = json_data['image']
-                
-                # Extract geo coordinates
-                if 'geo' in json_data and json_data['geo'].get('@type') == 'GeoCoordinates':
-                    data['latitude'] = json_data['geo'].get('latitude')
-                    data['longitude'] = json_data['geo'].get('longitude')
-                
-                # Extract payment methods
-                if 'paymentAccepted' in json_data:
-                    data['payment_methods'] = json_data['paymentAccepted']
-                
-                # Extract currencies accepted
-                if 'currenciesAccepted' in json_data:
-                    data['currencies_accepted'] = json_data['currenciesAccepted']
-                
-                # Extract review count from aggregateRating
-                if 'aggregateRating' in json_data:
-                    rating_data = json_data['aggregateRating']
-                    if 'reviewCount' in rating_data:
-                        data['total_review_count'] = rating_data['reviewCount']
-                    if 'ratingValue' in rating_data:
-                        data['overall_average_rating'] = rating_data['ratingValue']
-                
-                # Extract makesOffer (retainer info)
-                if 'makesOffer' in json_data:
-                    data['retainer_info'] = json_data['makesOffer']
-                
-                # Extract actual business website URL from sameAs
-                if 'sameAs' in json_data:
-                    data['company_website'] = json_data['sameAs']
-                
-                break  # Only need the first LocalBusiness entry
-        except:
-            pass
-    
     # Extract practice area percentages from pie chart
     practice_area_details = []
-    practice_area_section = soup.find('div', class_='practice-area-contents')
+    practice_area_section = _find_indexed(class_index, 'div', 'practice-area-contents')
     if practice_area_section:
-        pa_detail_divs = practice_area_section.find_all('div', class_='practice-area-detail')
+        pa_detail_divs = _find_all_by_class(practice_area_section, 'div', 'practice-area-detail')
         for pa_div in pa_detail_divs:
             # Try both <div> and <a> tags with class 'practice-area-title'
-            pa_title = pa_div.find('div', class_='practice-area-title')
-            if not pa_title:
-                # Fallback: check for <a> tag with class 'practice-area-title'
-                pa_title = pa_div.find('a', class_='practice-area-title')
+            pa_title = _practice_area_title(pa_div)
             
             if pa_title:
-                strong_tags = pa_title.find_all('strong')
+                # Only the name and percentage (first two strong tags) are needed
+                strong_tags = pa_title.find_all('strong', limit=2)
                 if len(strong_tags) >= 2:
-                    pa_name = strong_tags[0].get_text(strip=True)
-                    pa_percentage = strong_tags[1].get_text(strip=True)
+                    pa_name = _text(strong_tags[0])
+                    pa_percentage = _text(strong_tags[1])
                     # Only add if both name and percentage are valid
                     if pa_name and pa_percentage and '%' in pa_percentage:
                         practice_area_details.append(f"{pa_name}: {pa_percentage}")
@@ -720,10 +1179,12 @@ def _extract_data_from_soup(soup, review_date_filter=None):
         data['practice_area_percentages'] = ', '.join(practice_area_details)
     
     # Extract cost details and payment methods from Fees section
-    fees_section = soup.find('section', class_='fees-and-rates-container')
+    fees_section = _find_indexed(class_index, 'section', 'fees-and-rates-container')
     if fees_section:
+        # Find the retainer, payment list and cost headings in one pass
+        retainer_elem, payment_ul, cost_h4 = _scan_fees_section(fees_section)
+        
         # Extract retainer info
-        retainer_elem = fees_section.find('strong', string=re.compile(r'Retainer', re.IGNORECASE))
         if retainer_elem:
             retainer_parent = retainer_elem.find_parent('div')
             if retainer_parent:
@@ -738,7 +1199,6 @@ def _extract_data_from_soup(soup, review_date_filter=None):
         
         # Extract payment methods from list
         payment_methods_list = []
-        payment_ul = fees_section.find('ul')
         if payment_ul:
             payment_items = payment_ul.find_all('li')
             for item in payment_items:
@@ -751,29 +1211,26 @@ def _extract_data_from_soup(soup, review_date_filter=None):
         
         # Extract cost details
         cost_elements = []
-        cost_h4 = fees_section.find('h4', string=re.compile(r'Cost', re.IGNORECASE))
         if cost_h4:
             # Find the parent div that contains cost information
             cost_parent = cost_h4.find_parent('div', class_='frc-sub-section-body')
             if cost_parent:
                 # Find all divs with flex column that contain cost info
-                cost_divs = cost_parent.find_all('div', style=re.compile(r'flex-direction: column'))
+                cost_divs = cost_parent.find_all('div', style=_RE_FLEX_COL)
                 for cost_div in cost_divs:
                     strong = cost_div.find('strong')
                     p = cost_div.find('p')
                     if strong and p:
-                        cost_type = strong.get_text(strip=True)
+                        cost_type = _text(strong)
                         cost_value = p.get_text(strip=True)
                         cost_elements.append(f"{cost_type}: {cost_value}")
         
         if cost_elements:
             data['cost_details'] = ' | '.join(cost_elements)
     
-    # Extract detailed license information
-    license_section = soup.find('section', class_='license-container')
-    if license_section:
+    # Extract detailed license information (same license items as the bar admissions)
+    if license_items:
         license_details = []
-        license_items = license_section.find_all('div', class_='license')
         for item in license_items:
             license_parts = []
             
@@ -781,25 +1238,25 @@ def _extract_data_from_soup(soup, review_date_filter=None):
             state_elem = item.find('span', class_='state')
             state = None
             if state_elem:
-                state = state_elem.get_text(strip=True)
+                state = _text(state_elem)
             
             # Acquired date
             date_elem = item.find('span', class_='date')
             acquired = None
             if date_elem:
-                acquired = date_elem.get_text(strip=True)
+                acquired = _text(date_elem)
             
             # Status
             status_elem = item.find('span', class_='status-pill')
             status = None
             if status_elem:
-                status = status_elem.get_text(strip=True)
+                status = _text(status_elem)
             
             # Status description
             status_desc = item.find('p', class_='license-status')
             status_description = None
             if status_desc:
-                status_description = status_desc.get_text(strip=True)
+                status_description = _text(status_desc)
             
             # Build readable format: "State (Acquired: Year, Status: Status, Description)"
             if state:
@@ -823,57 +1280,44 @@ def _extract_data_from_soup(soup, review_date_filter=None):
             data['license_details'] = ' | '.join(license_details)
     
     # Extract send message link
-    message_link = soup.find('a', class_='v-cta-message')
+    message_link = _find_indexed(class_index, 'a', 'v-cta-message')
     if message_link and message_link.get('href'):
         data['send_message_link'] = message_link['href']
     else:
         # Try alternative selectors
-        message_link = soup.find('a', {'data-pp': 'msg_initiated'})
+        message_link = tag_index['msg'][0] if tag_index['msg'] else None
         if message_link and message_link.get('href'):
             data['send_message_link'] = message_link['href']
     
     # Extract Google Maps directions link
-    directions_link = soup.find('a', string=re.compile(r'Get Directions', re.IGNORECASE))
+    directions_link = tag_index['directions'][0] if tag_index['directions'] else None
     if directions_link and directions_link.get('href'):
         data['google_map_directions_link'] = directions_link['href']
     else:
         # Try alternative selector
-        directions_link = soup.find('a', {'aria_label': 'Get Directions'})
+        directions_link = tag_index['directions_label'][0] if tag_index['directions_label'] else None
         if directions_link and directions_link.get('href'):
             data['google_map_directions_link'] = directions_link['href']
     
     # Extract profile photo URL from img tag if not found in JSON-LD
     if not data.get('profile_photo_url'):
-        profile_img = soup.find('img', alt=re.compile(r'headshot', re.IGNORECASE))
+        profile_img = tag_index['headshot_alt'][0] if tag_index['headshot_alt'] else None
         if profile_img and profile_img.get('src'):
             data['profile_photo_url'] = profile_img['src']
         else:
             # Try finding img with headshot in src
-            profile_img = soup.find('img', src=re.compile(r'head_shot', re.IGNORECASE))
+            profile_img = tag_index['headshot_src'][0] if tag_index['headshot_src'] else None
             if profile_img and profile_img.get('src'):
                 data['profile_photo_url'] = profile_img['src']
     
     # Extract individual reviews
     reviews = []
-    review_containers = soup.find_all('div', class_='client-review')
+    review_containers = [tag for tag in class_index.get('client-review', ()) if tag.name == 'div']
     for container in review_containers:
-        review_data = {
-            'reviewer_name': None,
-            'review_date': None,
-            'review_rating': 0,
-            'review_title': None,
-            'review_text': None,
-            'review_type': None,  # e.g., "Consulted Attorney"
-            'review_tooltip': None,  # Tooltip explanation if available
-            # Attorney response fields
-            'attorney_response_name': None,  # Attorney name who replied
-            'attorney_response_date': None,  # Date attorney replied
-            'attorney_response_text': None  # Attorney's reply text
-        }
+        review_data = _REVIEW_TEMPLATE.copy()
         
         # Extract rating (count stars)
-        star_icons = container.find_all('i', class_='icon-star-yellow')
-        review_data['review_rating'] = len(star_icons)
+        review_data['review_rating'] = _count_stars(container)
         
         # Extract reviewer name and date
         header = container.find('div', class_='client-review-header')
@@ -888,8 +1332,8 @@ def _extract_data_from_soup(soup, review_date_filter=None):
             if first_para:
                 # Extract review type from span (if exists) - clean, no tooltip text
                 review_type_span = first_para.find('span')
-                if review_type_span and not review_type_span.find_parent('div', class_='tooltip'):
-                    type_text = review_type_span.get_text(strip=True)
+                if review_type_span and not _in_tooltip(review_type_span, container):
+                    type_text = _text(review_type_span)
                     # Clean up pipes and extract just the type (no tooltip text)
                     type_text = type_text.strip('|').strip()
                     if type_text and 'This review is from' not in type_text:
@@ -902,37 +1346,25 @@ def _extract_data_from_soup(soup, review_date_filter=None):
                     para_text = para_text.replace(f"| {review_data['review_type']}", "").strip()
                 
                 # Extract "Posted by NAME | DATE"
-                match = re.search(r'Posted by (.+?)\s*\|\s*(.+?)(?:\s*\|)?$', para_text)
+                match = _RE_POSTED_BY.search(para_text)
                 if match:
                     review_data['reviewer_name'] = match.group(1).strip()
-                    date_str = match.group(2).strip()
-                    
                     # Parse date
-                    try:
-                        for fmt in ['%B %d, %Y', '%b %d, %Y', '%m/%d/%Y', '%B %d,%Y']:
-                            try:
-                                review_date = datetime.strptime(date_str, fmt)
-                                review_data['review_date'] = review_date.strftime('%Y-%m-%d')
-                                break
-                            except:
-                                continue
-                    except:
-                        pass
+                    review_data['review_date'] = _parse_review_date(match.group(2).strip())
         
         # Extract review title
         title_elem = container.find('h4')
         if title_elem:
-            review_data['review_title'] = title_elem.get_text(strip=True)
+            review_data['review_title'] = _text(title_elem)
         
         # Extract review text
         content = container.find('div', class_='client-review-content')
         if content:
             text_parts = []
-            for p in content.find_all('p'):
-                for span in p.find_all('span'):
-                    text = span.get_text(strip=True)
-                    if text and text not in ['...', '…', 'See Full Review']:
-                        text_parts.append(text)
+            for span in content.select('p span'):
+                text = span.get_text(strip=True)
+                if text and text not in _REVIEW_TEXT_SKIP:
+                    text_parts.append(text)
             review_data['review_text'] = ' '.join(text_parts).strip()
         
         # Extract attorney response (if exists)
@@ -941,27 +1373,17 @@ def _extract_data_from_soup(soup, review_date_filter=None):
             # Extract attorney name
             attorney_name_h4 = response_container.find('h4')
             if attorney_name_h4:
-                review_data['attorney_response_name'] = attorney_name_h4.get_text(strip=True)
+                review_data['attorney_response_name'] = _text(attorney_name_h4)
             
             # Extract reply date
             reply_date_span = response_container.find('span')
             if reply_date_span:
-                reply_date_text = reply_date_span.get_text(strip=True)
+                reply_date_text = _text(reply_date_span)
                 # Parse "Replied last August 3, 2025" or "Replied last Aug 3, 2025"
-                date_match = re.search(r'Replied last (.+)', reply_date_text, re.IGNORECASE)
+                date_match = _RE_REPLIED_LAST.search(reply_date_text)
                 if date_match:
-                    date_str = date_match.group(1).strip()
                     # Parse date
-                    try:
-                        for fmt in ['%B %d, %Y', '%b %d, %Y', '%m/%d/%Y', '%B %d,%Y']:
-                            try:
-                                reply_date = datetime.strptime(date_str, fmt)
-                                review_data['attorney_response_date'] = reply_date.strftime('%Y-%m-%d')
-                                break
-                            except:
-                                continue
-                    except:
-                        pass
+                    review_data['attorney_response_date'] = _parse_review_date(date_match.group(1).strip())
             
             # Extract reply text
             reply_text_p = response_container.find('p')
@@ -982,6 +1404,23 @@ def _extract_data_from_soup(soup, review_date_filter=None):
     return data, reviews
 
 
+def _clean_csv_text(row):
+    """
+    Collapse newlines, carriage returns and multiple spaces in the text fields into single spaces (prevents CSV row breaks)
+    
+    Args:
+        row: Row dictionary (modified in place)
+    
+    Returns:
+        The same row dictionary
+    """
+    for field in _CSV_TEXT_FIELDS:
+        value = row.get(field)
+        if value is not None:
+            row[field] = _RE_WS.sub(' ', str(value)).strip()
+    return row
+
+
 def save_to_csv(data, reviews, output_csv_path):
     """
     Save extracted data and reviews to CSV file
@@ -991,65 +1430,29 @@ def save_to_csv(data, reviews, output_csv_path):
         reviews: List of review dictionaries
         output_csv_path: Path to output CSV file
     """
-    # Create rows - one row per review with all profile data
-    rows = []
-    
-    # If there are reviews, create one row per review with all profile data
-    if reviews:
-        for review in reviews:
-            row = data.copy()
-            # Add review-specific fields to each row
-            row['reviewer_name'] = review.get('reviewer_name')
-            row['review_date'] = review.get('review_date')
-            row['review_rating'] = review.get('review_rating')
-            row['review_title'] = review.get('review_title')
-            row['review_text'] = review.get('review_text')
-            row['review_type'] = review.get('review_type')
-            row['review_tooltip'] = review.get('review_tooltip')
-            # Add attorney response fields
-            row['attorney_response_name'] = review.get('attorney_response_name')
-            row['attorney_response_date'] = review.get('attorney_response_date')
-            row['attorney_response_text'] = review.get('attorney_response_text')
-            rows.append(row)
-    else:
-        # No reviews - just one row with profile data and empty review fields
-        row = data.copy()
-        row['reviewer_name'] = None
-        row['review_date'] = None
-        row['review_rating'] = None
-        row['review_title'] = None
-        row['review_text'] = None
-        row['review_type'] = None
-        row['review_tooltip'] = None
-        row['attorney_response_name'] = None
-        row['attorney_response_date'] = None
-        row['attorney_response_text'] = None
-        rows.append(row)
-    
-    # Clean text fields - replace newlines with spaces to prevent CSV row breaks
-    text_fields = ['review_text', 'review_title', 'attorney_response_text', 'biography', 'company_address', 
-                    'education', 'bar_admissions', 'honors_awards', 'associations', 
-                    'work_experience', 'practice_areas', 'additional_practice_areas',
-                    'practice_area_percentages', 'cost_details', 'retainer_info',
-                    'payment_methods', 'license_details']
-    
-    for row in rows:
-        for field in text_fields:
-            if field in row and row[field] is not None:
-                # Replace newlines and carriage returns with spaces
-                row[field] = str(row[field]).replace('\n', ' ').replace('\r', ' ')
-                # Clean up multiple spaces
-                row[field] = re.sub(r'\s+', ' ', row[field]).strip()
-    
-    # Create DataFrame
-    df = pd.DataFrame(rows)
+    # Profile fields are the same on every row - clean them once and share them
+    # (columns = profile fields in template order, then the review fields)
+    profile = _clean_csv_text(dict(data))
+    columns = list(profile) + list(_REVIEW_CSV_FIELDS)
+    profile_values = list(profile.values())
     
     # Save to CSV - use minimal quoting (only when needed) like the working example
-    df.to_csv(output_csv_path, index=False, encoding='utf-8', quoting=csv.QUOTE_MINIMAL)
+    # One row per review with all profile data, streamed straight to the writer
+    # (plain csv.writer rows in column order - no per-row dict lookups as in DictWriter)
+    with open(output_csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL, lineterminator=os.linesep)
+        writer.writerow(columns)
+        if reviews:
+            for review in reviews:
+                review_fields = _clean_csv_text({field: review.get(field) for field in _REVIEW_CSV_FIELDS})
+                writer.writerow(profile_values + list(review_fields.values()))
+        else:
+            # No reviews - just one row with profile data and empty review fields
+            writer.writerow(profile_values + [None] * len(_REVIEW_CSV_FIELDS))
     
     # Display review count
     if reviews:
-        print(f"✅ Created {len(rows)} rows ({len(reviews)} reviews + profile data in each row)")
+        print(f"✅ Created {len(reviews)} rows ({len(reviews)} reviews + profile data in each row)")
     else:
         print(f"✅ Created 1 row (profile data, no reviews)")
     
@@ -1064,7 +1467,7 @@ def save_to_csv(data, reviews, output_csv_path):
     if data.get('biography'):
         bio_preview = data['biography'][:100] + "..." if len(data['biography']) > 100 else data['biography']
         print(f"   - Biography: {bio_preview}")
-    print(f"\n📋 Total columns extracted: {len(df.columns)}")
+    print(f"\n📋 Total columns extracted: {len(columns)}")
     
     return True
 
@@ -1081,6 +1484,19 @@ def convert_html_to_csv(html_file_path, output_csv_path=None):
     
     data, reviews = extract_profile_data(html_file_path)
     
+    return _save_converted(html_file_path, data, reviews, output_csv_path)
+
+
+def _save_converted(html_file_path, data, reviews, output_csv_path=None):
+    """
+    Save the data extracted from one HTML file to its CSV
+    
+    Args:
+        html_file_path: Path to the input HTML file (used for the fallback output name)
+        data: Dictionary with profile data (None if extraction failed)
+        reviews: List of review dictionaries
+        output_csv_path: Path to output CSV file (optional - named after the profile ID if omitted)
+    """
     if not data:
         print("❌ Failed to extract data from HTML")
         return False
@@ -1091,7 +1507,7 @@ def convert_html_to_csv(html_file_path, output_csv_path=None):
         profile_url = data.get('profile_url', '')
         if profile_url:
             # Extract the ID part from URL like: /attorneys/90069-ca-michelle-paul-1896813.html
-            match = re.search(r'/attorneys/([^/]+)\.html', profile_url)
+            match = _RE_NOMEN.search(profile_url)
             if match:
                 user_id = match.group(1)
                 output_csv_path = f"{user_id}.csv"
@@ -1106,6 +1522,25 @@ def convert_html_to_csv(html_file_path, output_csv_path=None):
     return save_to_csv(data, reviews, output_csv_path)
 
 
+def _extract_file_quietly(html_file_path):
+    """
+    Worker for main(): extract one HTML file and capture its console output
+    (the parent prints it and writes the CSV in file order, so parallel workers
+    neither interleave their output nor write the same CSV at the same time)
+    
+    Args:
+        html_file_path: Path to input HTML file
+        
+    Returns:
+        Tuple of (data dictionary, reviews list, captured output)
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        print(f"📄 Reading HTML file: {html_file_path}")
+        data, reviews = extract_profile_data(html_file_path)
+    return data, reviews, buffer.getvalue()
+
+
 def find_html_files(directory='.'):
     """
     Find all HTML files in the specified directory
@@ -1116,11 +1551,9 @@ def find_html_files(directory='.'):
     Returns:
         List of HTML file paths
     """
-    html_files = []
-    for filename in os.listdir(directory):
-        if filename.endswith('.html') and os.path.isfile(os.path.join(directory, filename)):
-            html_files.append(os.path.join(directory, filename))
-    return sorted(html_files)
+    # scandir entries carry the file type from the directory listing - no extra stat per file
+    with os.scandir(directory) as entries:
+        return sorted(entry.path for entry in entries if entry.name.endswith('.html') and entry.is_file())
 
 
 def main():
@@ -1164,14 +1597,30 @@ def main():
         successful = 0
         failed = 0
         
-        for i, html_file in enumerate(html_files, 1):
-            print(f"\n[{i}/{len(html_files)}] Processing: {os.path.basename(html_file)}")
-            print("-" * 70)
-            
-            if convert_html_to_csv(html_file):
-                successful += 1
-            else:
-                failed += 1
+        workers = min(FILE_WORKERS, len(html_files))
+        if workers > 1:
+            # Files are independent - parse them in worker processes, save the CSVs here in order
+            chunksize = max(1, len(html_files) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(_extract_file_quietly, html_files, chunksize=chunksize)
+                for i, (html_file, (data, reviews, output)) in enumerate(zip(html_files, results), 1):
+                    print(f"\n[{i}/{len(html_files)}] Processing: {os.path.basename(html_file)}")
+                    print("-" * 70)
+                    print(output, end='')
+                    
+                    if _save_converted(html_file, data, reviews):
+                        successful += 1
+                    else:
+                        failed += 1
+        else:
+            for i, html_file in enumerate(html_files, 1):
+                print(f"\n[{i}/{len(html_files)}] Processing: {os.path.basename(html_file)}")
+                print("-" * 70)
+                
+                if convert_html_to_csv(html_file):
+                    successful += 1
+                else:
+                    failed += 1
         
         print(f"\n{'='*70}")
         print("SUMMARY")
@@ -1183,5 +1632,6 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
 
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Tests for html_to_csv_converter.py
+Run with: python -m unittest test_html_to_csv_converter
+"""
+
+import unittest
+
+from html_to_csv_converter import make_profile_soup
+
+PAGE = (
+    '<!DOCTYPE html><html><head><title>Profile</title>'
+    '<script>var tracking = "not profile data";</script>'
+    '<script type="application/ld+json">{"@type": "LocalBusiness"}</script>'
+    '<style>.a { color: red }</style>'
+    '<link rel="canonical" href="https://www.avvo.com/attorneys/94401-ca-jane-doe-1.html">'
+    '</head><body>Loose body text'
+    '<div class="profile"><script src="/app.js"></script><h1 class="profile-name">Jane Doe</h1></div>'
+    '<noscript>Enable JavaScript</noscript>'
+    '</body></html>'
+)
+
+
+class MakeProfileSoupTest(unittest.TestCase):
+
+    def _check(self, soup):
+        # Only the JSON-LD script is left - at the top level and nested in the body
+        scripts = soup.find_all('script')
+        self.assertEqual([script.get('type') for script in scripts], ['application/ld+json'])
+        self.assertIsNone(soup.find('style'))
+        self.assertIsNone(soup.find('noscript'))
+        # Profile markup and loose text in <body> are kept
+        self.assertIsNotNone(soup.find('link', rel='canonical'))
+        self.assertEqual(soup.find('h1', class_='profile-name').get_text(), 'Jane Doe')
+        self.assertIn('Loose body text', soup.get_text(' '))
+
+    def test_str_input(self):
+        self._check(make_profile_soup(PAGE))
+
+    def test_bytes_input(self):
+        self._check(make_profile_soup(PAGE.encode('utf-8')))
+
+
+if __name__ == '__main__':
+    unittest.main()